@@ -0,0 +1,105 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+**********
+Benchmark
+**********
+
+This file compares the integer programming formulations of the OptimizeByes problem,
+the time-indexed BaseILP and the round-index RoundIndexILP,
+by their model size and calculation time on acyclic team priorities.
+
+Each instance is solved at num_rounds = the critical path length (feasible)
+and at the critical path length - 1 (Gurobi proves the infeasibility).
+BaseILP is solved without the presolve, which would decide the infeasible case without Gurobi,
+and with it. The cyclic priorities are skipped, since every formulation rejects them before Gurobi.
+
+With a size-limited Gurobi license, the models which are too large are reported as skipped.
+"""
+
+import argparse
+import statistics
+import time
+
+import gurobipy as gp
+import numpy as np
+
+import optbyes as opb
+from optbyes.utils import converter, generator, precedence
+
+FACTORIES: dict[str, opb.ILPFactory] = {
+    "BaseILP": opb.BaseILPFactory(presolve=False, params={"OutputFlag": 0}),
+    "BaseILP (presolve)": opb.BaseILPFactory(params={"OutputFlag": 0}),
+    "RoundIndexILP": opb.RoundIndexILPFactory(params={"OutputFlag": 0}),
+}
+
+
+def generate_instances(
+    num_teams: int, num_instances: int, rng: np.random.Generator
+) -> list[tuple[opb.TeamPriorityArray, int]]:
+    """Generate acyclic priorities (half of them feasible ones perturbed by a swap) with their lower bounds"""
+    instances = []
+    while len(instances) < num_instances:
+        array = generator.generate_near_feasible_priority_array(num_teams, len(instances) % 2, rng)
+        team_priority = converter.convert_priority_array_to_team_priority(array)
+        analysis = precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+        if not analysis.is_acyclic():
+            continue
+        tp_array = converter.convert_team_priority_to_team_priority_array(team_priority)
+        instances.append((tp_array, max(num_teams - 1, analysis.get_lower_bound())))
+    return instances
+
+
+def benchmark_ilp_formulations(num_teams_list: list[int], num_instances: int = 10, seed: int = 0) -> None:
+    """Benchmark the ILP formulations
+
+    For each number of teams, print the model size of the first instance at its lower bound,
+    and the median calculation time of the feasible (lower bound) and infeasible (lower bound - 1) problems.
+
+    Parameters
+    -----
+    num_teams_list: list[int]
+        The numbers of teams to benchmark
+
+    num_instances: int, optional (default = 10)
+        The number of team priorities for each number of teams
+
+    seed: int, optional (default = 0)
+        The random seed
+    """
+    rng = np.random.default_rng(seed)
+    for num_teams in num_teams_list:
+        instances = generate_instances(num_teams, num_instances, rng)
+        for name, factory in FACTORIES.items():
+            try:
+                num_vars, num_constrs = 0, 0
+                feasible_times, infeasible_times = [], []
+                for tp_array, lower_bound in instances:
+                    for num_rounds, calc_times in [(lower_bound, feasible_times), (lower_bound - 1, infeasible_times)]:
+                        prob = factory.create(num_teams, num_rounds, tp_array)
+                        start_time = time.perf_counter()
+                        prob.solve()
+                        calc_times.append(time.perf_counter() - start_time)
+                        if num_vars == 0:
+                            num_vars, num_constrs = prob.get_model_size()
+            except gp.GurobiError as e:
+                print(f"{num_teams = }, {name}: skipped ({e})")
+                continue
+            print(
+                f"{num_teams = }, {name}: {num_vars = }, {num_constrs = }, "
+                f"median calc_time = {statistics.median(feasible_times):.4f} [s] (feasible), "
+                f"{statistics.median(infeasible_times):.4f} [s] (infeasible)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-teams", type=int, nargs="+", default=[4, 5, 6, 7, 8, 10])
+    parser.add_argument("--num-instances", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    benchmark_ilp_formulations(args.num_teams, args.num_instances, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ how many rounds can be achieved.
 import itertools
 
 import optbyes as opb
-from optbyes.utils import converter, generator
+from optbyes.utils import converter, enumerator, generator
 
 
 def experiment_all_combs_with_gurobi(num_teams: int, num_fixed: int = 0) -> None:
@@ -110,6 +110,26 @@ def experiment_all_combs_with_graph_algorithm(num_teams: int) -> None:
     print(f"{cnt = }, {cnt_feasible = }")
 
 
+def experiment_all_combs_with_branch_and_count(num_teams: int, num_fixed: int = 0) -> None:
+    """Experiment with the OptimizeByes problem by the prefix-pruned enumeration
+
+    Experiment with the OptimizeByes problem without testing every combination of priorities:
+    the combinations sharing a prefix that already creates a cycle are counted at once.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    num_fixed: int, optional (default = 0)
+        The number of teams fixing priorities.
+        Fixes the priority of teams from 1 to num_teams.
+    """
+    cnt, cnt_feasible, rounds = enumerator.count_feasible_team_priorities(num_teams, num_fixed)
+    print(f"{cnt = }, {cnt_feasible = }, {rounds = }")
+
+
 if __name__ == "__main__":
     experiment_all_combs_with_gurobi(num_teams=4, num_fixed=1)
     experiment_all_combs_with_graph_algorithm(num_teams=4)
+    experiment_all_combs_with_branch_and_count(num_teams=4)
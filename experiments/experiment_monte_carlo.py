@@ -0,0 +1,161 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+**********
+Monte Carlo Experiments
+**********
+
+This file contains a Monte Carlo estimator of the OptimizeByes problem for the numbers of teams
+whose combinations of priorities can not be enumerated. Random priorities are drawn and solved by
+the graph algorithm in worker processes, until the confidence intervals of the feasibility rate
+and of the distribution of the number of rounds are narrow enough.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TypedDict
+
+import numpy as np
+from scipy import stats
+
+import optbyes as opb
+from optbyes.utils import converter, generator
+
+
+class MonteCarloReport(TypedDict):
+    num_teams: int
+    seed: int
+    cnt: int
+    cnt_feasible: int
+    feasible_rate: float
+    feasible_rate_interval: tuple[float, float]
+    rounds: dict[int, int]
+    rounds_interval: dict[int, tuple[float, float]]
+    instances_per_sec: float
+
+
+def _solve_batch(num_teams: int, seed: int, batch: int, batch_size: int) -> tuple[int, dict[int, int]]:
+    """Solve batch_size random instances and return (cnt_feasible, round histogram)"""
+    # The random numbers depend only on (seed, batch), not on the worker.
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(batch,)))
+    cnt_feasible = 0
+    rounds: dict[int, int] = {}
+    priority_array = np.empty((num_teams, num_teams - 1), dtype=np.uint16)
+    for _ in range(batch_size):
+        generator.generate_random_priority_array(num_teams, rng, out=priority_array)
+        tp = converter.convert_priority_array_to_team_priority(priority_array)
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver.solve()
+        if solver.get_status() == opb.OPTIMAL:
+            cnt_feasible += 1
+            num_rounds = solver.get_num_rounds()
+            rounds[num_rounds] = rounds.get(num_rounds, 0) + 1
+    return cnt_feasible, rounds
+
+
+def wilson_interval(cnt_success: int, cnt: int, confidence: float = 0.95) -> tuple[float, float]:
+    """Wilson score interval of a binomial proportion"""
+    if cnt == 0:
+        return 0.0, 1.0
+    z = float(stats.norm.ppf(0.5 + confidence / 2))
+    p = cnt_success / cnt
+    center = (p + z**2 / (2 * cnt)) / (1 + z**2 / cnt)
+    half_width = z * math.sqrt(p * (1 - p) / cnt + z**2 / (4 * cnt**2)) / (1 + z**2 / cnt)
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def estimate_feasibility(
+    num_teams: int,
+    seed: int = 0,
+    target_width: float = 0.01,
+    confidence: float = 0.95,
+    batch_size: int = 1000,
+    max_samples: int = 10**7,
+    max_workers: int | None = None,
+) -> MonteCarloReport:
+    """Estimate the feasibility rate and the distribution of the number of rounds
+
+    Random priorities are solved in batches by worker processes.
+    The batches are merged in order, and the estimation stops after the first batch at which
+    the confidence intervals of the feasibility rate and of the rate of every number of rounds
+    are at most target_width wide, so the result depends only on the seed (not on the workers).
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    seed: int, optional (default = 0)
+        The random seed
+
+    target_width: float, optional (default = 0.01)
+        The target width of the confidence intervals
+
+    confidence: float, optional (default = 0.95)
+        The confidence level of the (Wilson score) intervals
+
+    batch_size: int, optional (default = 1000)
+        The number of instances solved by a worker at once
+
+    max_samples: int, optional (default = 10**7)
+        The maximum number of instances
+
+    max_workers: int | None, optional (default = None)
+        The number of worker processes (the number of processors if None)
+
+    Returns
+    -----
+    report: MonteCarloReport
+        The estimated rates, their confidence intervals and the throughput (instances/sec)
+    """
+    start_time = time.perf_counter()
+    cnt, cnt_feasible = 0, 0
+    rounds: dict[int, int] = {}
+    max_batches = math.ceil(max_samples / batch_size)
+    num_workers = max_workers or os.cpu_count() or 1
+
+    def _width(cnt_success: int) -> float:
+        lower, upper = wilson_interval(cnt_success, cnt, confidence)
+        return upper - lower
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures: dict[int, Future[tuple[int, dict[int, int]]]] = {}
+        next_batch = 0
+        for batch in range(max_batches):
+            # Keep a few batches per worker in flight.
+            while next_batch < min(max_batches, batch + 2 * num_workers):
+                futures[next_batch] = executor.submit(_solve_batch, num_teams, seed, next_batch, batch_size)
+                next_batch += 1
+            batch_feasible, batch_rounds = futures.pop(batch).result()
+            cnt += batch_size
+            cnt_feasible += batch_feasible
+            for num_rounds, c in batch_rounds.items():
+                rounds[num_rounds] = rounds.get(num_rounds, 0) + c
+
+            widths = [_width(cnt_feasible)] + [_width(c) for c in rounds.values()]
+            if max(widths) <= target_width:
+                break
+        for future in futures.values():
+            future.cancel()
+
+    elapsed_time = time.perf_counter() - start_time
+    rounds = dict(sorted(rounds.items()))
+    return {
+        "num_teams": num_teams,
+        "seed": seed,
+        "cnt": cnt,
+        "cnt_feasible": cnt_feasible,
+        "feasible_rate": cnt_feasible / cnt,
+        "feasible_rate_interval": wilson_interval(cnt_feasible, cnt, confidence),
+        "rounds": rounds,
+        "rounds_interval": {r: wilson_interval(c, cnt, confidence) for r, c in rounds.items()},
+        "instances_per_sec": cnt / elapsed_time,
+    }
+
+
+if __name__ == "__main__":
+    for num_teams in [5, 6]:
+        report = estimate_feasibility(num_teams, seed=0, target_width=0.01)
+        print(report)
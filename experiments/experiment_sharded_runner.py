@@ -0,0 +1,297 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+**********
+Sharded Experiments
+**********
+
+This file contains a checkpointed, resumable runner for the exhaustive experiments.
+The profile index space of generate_team_priorities() is partitioned into shards,
+each shard periodically saves its progress (next index, feasible count and round histogram)
+to a checkpoint file, and the shard results are merged into a final report.
+
+Examples
+-----
+Run shard 0 of 4 (on one machine), then merge the checkpoints::
+
+    $ python experiment_sharded_runner.py run --num-teams 5 --num-shards 4 --shard 0 --checkpoint-dir ./ckpt
+    $ python experiment_sharded_runner.py merge --checkpoint-dir ./ckpt
+
+A preempted shard resumes from its last checkpoint when the same command is run again.
+With --store, the result of every profile is also written to a memory-mapped ResultStore
+shared by the shards, which can be queried later without rerunning the sweep.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import TypedDict
+
+import optbyes as opb
+from optbyes.utils import generator
+from optbyes.utils.result_store import ResultStore
+
+ALGORITHMS = ("graph", "gurobi")
+
+
+class ShardProgress(TypedDict):
+    num_teams: int
+    num_fixed: int
+    algorithm: str
+    num_shards: int
+    shard: int
+    start: int
+    stop: int
+    next_index: int
+    cnt: int
+    cnt_feasible: int
+    rounds: dict[int, int]
+
+
+def shard_range(num_profiles: int, num_shards: int, shard: int) -> tuple[int, int]:
+    """Decide the profile index range [start, stop) of the shard
+
+    Parameters
+    -----
+    num_profiles: int
+        The number of profiles in the whole index space
+
+    num_shards: int
+        The number of shards
+
+    shard: int
+        The shard number (0 <= shard < num_shards)
+
+    Returns
+    -----
+    (start, stop): tuple[int, int]
+        The profile index range of the shard.
+        The boundaries are multiples of 8, so that the shards write disjoint bytes of a ResultStore.
+    """
+    if not 0 <= shard < num_shards:
+        raise ValueError("shard must be in [0, num_shards).")
+    num_blocks = (num_profiles + 7) // 8
+    size, remainder = divmod(num_blocks, num_shards)
+    start = shard * size + min(shard, remainder)
+    stop = start + size + (1 if shard < remainder else 0)
+    return min(8 * start, num_profiles), min(8 * stop, num_profiles)
+
+
+def solve_profile(team_priority: opb.TeamPriority, algorithm: str) -> int | None:
+    """Solve the instance and return the number of rounds (None when infeasible)"""
+    solver: opb.OptByesAlgorithm
+    if algorithm == "graph":
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(team_priority)
+    elif algorithm == "gurobi":
+        solver = opb.IterateNumRoundsAlgorithm.create_from_team_priority(team_priority, opb.BaseILPFactory())
+    else:
+        raise ValueError(f"algorithm must be one of {ALGORITHMS}.")
+    solver.solve()
+    if solver.get_status() != opb.OPTIMAL:
+        return None
+    return solver.get_num_rounds()
+
+
+def _checkpoint_path(checkpoint_dir: Path, num_shards: int, shard: int) -> Path:
+    return checkpoint_dir / f"shard_{shard:04d}_of_{num_shards:04d}.json"
+
+
+def _save_checkpoint(path: Path, progress: ShardProgress) -> None:
+    # Write to a temporary file and rename it, so that a crash never leaves a broken checkpoint.
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(progress, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _load_checkpoint(path: Path) -> ShardProgress:
+    with open(path) as f:
+        progress: ShardProgress = json.load(f)
+    # JSON object keys are always strings
+    progress["rounds"] = {int(r): c for r, c in progress["rounds"].items()}
+    return progress
+
+
+def run_shard(
+    num_teams: int,
+    num_shards: int,
+    shard: int,
+    checkpoint_dir: str | Path,
+    algorithm: str = "graph",
+    num_fixed: int = 0,
+    checkpoint_interval: int = 1000,
+    store_path: str | Path | None = None,
+) -> ShardProgress:
+    """Run (or resume) one shard of the exhaustive experiment
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    num_shards: int
+        The number of shards the profile index space is partitioned into
+
+    shard: int
+        The shard number to run (0 <= shard < num_shards)
+
+    checkpoint_dir: str | Path
+        The directory where the checkpoint files are saved
+
+    algorithm: str, optional (default = "graph")
+        "graph" (TopologicalSortAlgorithm) or "gurobi" (IterateNumRoundsAlgorithm)
+
+    num_fixed: int, optional (default = 0)
+        The number of teams fixing priorities.
+
+    checkpoint_interval: int, optional (default = 1000)
+        The number of profiles solved between checkpoints
+
+    store_path: str | Path | None, optional (default = None)
+        The ResultStore file the result of every profile is written to (created if it does not exist)
+
+    Returns
+    -----
+    progress: ShardProgress
+        The final progress of the shard
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    path = _checkpoint_path(checkpoint_dir, num_shards, shard)
+
+    num_profiles = generator.count_team_priorities(num_teams, num_fixed)
+    start, stop = shard_range(num_profiles, num_shards, shard)
+    progress: ShardProgress = {
+        "num_teams": num_teams,
+        "num_fixed": num_fixed,
+        "algorithm": algorithm,
+        "num_shards": num_shards,
+        "shard": shard,
+        "start": start,
+        "stop": stop,
+        "next_index": start,
+        "cnt": 0,
+        "cnt_feasible": 0,
+        "rounds": {},
+    }
+    if path.exists():
+        saved = _load_checkpoint(path)
+        for key in ("num_teams", "num_fixed", "algorithm", "start", "stop"):
+            if saved[key] != progress[key]:  # type: ignore[literal-required]
+                raise ValueError(f"The checkpoint {path} was made with a different {key}.")
+        progress = saved
+
+    store = None if store_path is None else ResultStore.create(store_path, num_profiles, num_teams, num_fixed)
+    try:
+        for index in range(progress["next_index"], stop):
+            tp = generator.unrank_team_priority(num_teams, index, num_fixed)
+            num_rounds = solve_profile(tp, algorithm)
+            if num_rounds is not None:
+                progress["cnt_feasible"] += 1
+                progress["rounds"][num_rounds] = progress["rounds"].get(num_rounds, 0) + 1
+            if store is not None:
+                store.write(index, num_rounds)
+            progress["cnt"] += 1
+            progress["next_index"] = index + 1
+            if progress["cnt"] % checkpoint_interval == 0:
+                if store is not None:
+                    store.flush()  # the checkpoint must not be ahead of the store
+                _save_checkpoint(path, progress)
+    finally:
+        if store is not None:
+            store.close()
+    _save_checkpoint(path, progress)
+    return progress
+
+
+def merge_shards(checkpoint_dir: str | Path) -> ShardProgress:
+    """Merge the checkpoints of all shards into a final report
+
+    Parameters
+    -----
+    checkpoint_dir: str | Path
+        The directory where the checkpoint files are saved
+
+    Returns
+    -----
+    report: ShardProgress
+        The merged result. The shard-specific fields describe the whole index space.
+    """
+    paths = sorted(Path(checkpoint_dir).glob("shard_*_of_*.json"))
+    if not paths:
+        raise FileNotFoundError(f"No checkpoint in {checkpoint_dir}.")
+    shards = [_load_checkpoint(path) for path in paths]
+
+    first = shards[0]
+    num_shards = first["num_shards"]
+    if sorted(s["shard"] for s in shards) != list(range(num_shards)):
+        raise ValueError(f"Expected checkpoints of {num_shards} shards in {checkpoint_dir}.")
+    for s in shards:
+        for key in ("num_teams", "num_fixed", "algorithm", "num_shards"):
+            if s[key] != first[key]:  # type: ignore[literal-required]
+                raise ValueError(f"The checkpoints in {checkpoint_dir} have different {key}.")
+        if s["next_index"] != s["stop"]:
+            raise ValueError(f"Shard {s['shard']} has not finished ({s['next_index']} / {s['stop']}).")
+
+    report: ShardProgress = {
+        "num_teams": first["num_teams"],
+        "num_fixed": first["num_fixed"],
+        "algorithm": first["algorithm"],
+        "num_shards": num_shards,
+        "shard": -1,
+        "start": min(s["start"] for s in shards),
+        "stop": max(s["stop"] for s in shards),
+        "next_index": max(s["stop"] for s in shards),
+        "cnt": sum(s["cnt"] for s in shards),
+        "cnt_feasible": sum(s["cnt_feasible"] for s in shards),
+        "rounds": {},
+    }
+    for s in shards:
+        for num_rounds, c in s["rounds"].items():
+            report["rounds"][num_rounds] = report["rounds"].get(num_rounds, 0) + c
+    report["rounds"] = dict(sorted(report["rounds"].items()))
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run (or resume) one shard")
+    run_parser.add_argument("--num-teams", type=int, required=True)
+    run_parser.add_argument("--num-fixed", type=int, default=0)
+    run_parser.add_argument("--algorithm", choices=ALGORITHMS, default="graph")
+    run_parser.add_argument("--num-shards", type=int, default=1)
+    run_parser.add_argument("--shard", type=int, default=0)
+    run_parser.add_argument("--checkpoint-dir", required=True)
+    run_parser.add_argument("--checkpoint-interval", type=int, default=1000)
+    run_parser.add_argument("--store", default=None, help="ResultStore file the results are written to")
+
+    merge_parser = subparsers.add_parser("merge", help="merge the shard checkpoints into a report")
+    merge_parser.add_argument("--checkpoint-dir", required=True)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        progress = run_shard(
+            args.num_teams,
+            args.num_shards,
+            args.shard,
+            args.checkpoint_dir,
+            algorithm=args.algorithm,
+            num_fixed=args.num_fixed,
+            checkpoint_interval=args.checkpoint_interval,
+            store_path=args.store,
+        )
+        print(f"shard = {progress['shard']}, cnt = {progress['cnt']}, cnt_feasible = {progress['cnt_feasible']}")
+    else:
+        report = merge_shards(args.checkpoint_dir)
+        print(f"cnt = {report['cnt']}, cnt_feasible = {report['cnt_feasible']}")
+        for num_rounds, c in report["rounds"].items():
+            print(f"num_rounds = {num_rounds}: {c}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+**********
+Parameter Tuning
+**********
+
+This file tunes the Gurobi parameters of the ILP factories and saves them to the tuned parameter file
+(the path in OPTBYES_TUNED_PARAMS, or ~/.optbyes/tuned_params.json by default),
+from which the factories load them when it is given, e.g., opb.BaseILPFactory(tuned_params=path)
+or optbyes profiles.jsonl --algorithm gurobi --tuned-params path,
+or when OPTBYES_TUNED_PARAMS is set.
+"""
+
+import argparse
+
+import optbyes as opb
+
+FACTORIES = {
+    "BaseILPFactory": opb.BaseILPFactory,
+    "RoundIndexILPFactory": opb.RoundIndexILPFactory,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--factory", choices=FACTORIES, default="BaseILPFactory")
+    parser.add_argument("--min-teams", type=int, required=True)
+    parser.add_argument("--max-teams", type=int, required=True)
+    parser.add_argument("--method", choices=("grid", "random"), default="random")
+    parser.add_argument("--num-candidates", type=int, default=20)
+    parser.add_argument("--num-instances", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="the tuned parameter file")
+    args = parser.parse_args()
+
+    result = opb.tune_params(
+        FACTORIES[args.factory],
+        (args.min_teams, args.max_teams),
+        method=args.method,
+        num_candidates=args.num_candidates,
+        num_instances=args.num_instances,
+        seed=args.seed,
+        path=args.output,
+    )
+    print(f"params = {result['params']}, median = {result['median']:.4f} s, p95 = {result['p95']:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@ from optbyes._config import *
 from optbyes._exception import *
 from optbyes._typing import *
 from optbyes import utils
+from optbyes.algorithm.integer_planning_problems.template_cache import *
 from optbyes.algorithm.integer_planning_problems.integer_planning_problems import *
 from optbyes.algorithm.integer_planning_problems.factory import *
+from optbyes.algorithm.integer_planning_problems.tuning import *
 from optbyes.algorithm.algorithm import *
 from optbyes.drawing.graph import *
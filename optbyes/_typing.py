@@ -3,9 +3,11 @@ TeamPriority = dict[int, OpposingTeams]
 
 Status = int
 Schedule = dict[int, dict[int, int]]
+UnavailableRounds = dict[int, set[int]]
 
 # Integer Programming Model
 TeamPriorityArray = dict[tuple[int, int, int], int]
+GurobiParams = dict[str, int | float]
 
 # Graph
 OpbNode = tuple[int, int]
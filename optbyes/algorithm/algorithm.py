@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import multiprocessing
 from abc import ABCMeta, abstractmethod
-from typing import final
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Iterator, final
 
 import networkx as nx
+import numpy as np
 from scipy import special
 
 import optbyes as opb
-from optbyes.utils import converter
+from optbyes.utils import converter, precedence
+from optbyes.utils.priority_array import PriorityArray, TeamPriorityLike
 
-__all__ = ["OptByesAlgorithm", "TopologicalSortAlgorithm", "IterateNumRoundsAlgorithm"]
+__all__ = [
+    "OptByesAlgorithm",
+    "TopologicalSortAlgorithm",
+    "IterateNumRoundsAlgorithm",
+    "MinRoundsAlgorithm",
+    "UnavailableRoundsAlgorithm",
+    "ReschedulingAlgorithm",
+]
 
 
 class OptByesAlgorithm(metaclass=ABCMeta):
@@ -25,11 +38,36 @@ class OptByesAlgorithm(metaclass=ABCMeta):
     def __init__(self) -> None:
         self._status: opb.Status = opb.LOADED
         self._schedule: opb.Schedule = {}
+        self._analysis: precedence.CriticalPathAnalysis | None = None
 
     @abstractmethod
     def solve(self) -> None:
         raise NotImplementedError()
 
+    def _create_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        """Create the analytics from the team priority of the schedule (which requires solve())
+
+        The algorithms override this to create them from their input,
+        so that they are available before solve().
+        """
+        schedule = self.get_schedule()
+        team_priority = {
+            t: tuple(j for _, j in sorted(opposing_teams.items()) if j != opb.BYES)
+            for t, opposing_teams in schedule.items()
+        }
+        return precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+
+    @final
+    def get_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        """Return the critical path analytics of the match precedence graph
+
+        The earliest and latest rounds, the slacks, the critical chain, the lower bound of the number of rounds
+        and the earliest finish of each team are computed once and cached on this instance.
+        """
+        if self._analysis is None:
+            self._analysis = self._create_critical_path_analysis()
+        return self._analysis
+
     @final
     def get_status(self) -> opb.Status:
         return self._status
@@ -93,11 +131,13 @@ class TopologicalSortAlgorithm(OptByesAlgorithm):
     This algorithm solves the base problem using topological sort
     and check whether the instance is feasible or not,
     if so, how many rounds can be achieved.
+    The rounds can also be streamed one by one with iter_rounds().
     """
 
     def __init__(self) -> None:
         super().__init__()
         self._num_teams: int
+        self._team_priority: TeamPriorityLike | None = None
         self._G: nx.DiGraph
 
     @classmethod
@@ -123,13 +163,13 @@ class TopologicalSortAlgorithm(OptByesAlgorithm):
         return algorithm
 
     @classmethod
-    def create_from_team_priority(cls, team_priority: opb.TeamPriority) -> TopologicalSortAlgorithm:
+    def create_from_team_priority(cls, team_priority: TeamPriorityLike) -> TopologicalSortAlgorithm:
         """Create instances of algorithm from team_priority
 
         Parameters
         -----
-        team_priority: opb.TeamPriority
-            A dictionary of the team's desired priority order
+        team_priority: TeamPriorityLike
+            A dictionary of the team's desired priority order (or its PriorityArray)
 
         Returns
         -----
@@ -138,10 +178,136 @@ class TopologicalSortAlgorithm(OptByesAlgorithm):
         """
         algorithm = cls()
         algorithm._num_teams = len(team_priority)
+        algorithm._team_priority = team_priority
         G = converter.convert_team_priority_to_graph(team_priority)
         algorithm._G = G
         return algorithm
 
+    def _get_team_priority(self) -> opb.TeamPriority:
+        if self._team_priority is None:
+            # created from a graph (raises ValueError if the graph does not express a team priority)
+            self._team_priority = converter.convert_graph_to_team_priority(self._num_teams, self._G)
+        if isinstance(self._team_priority, PriorityArray):
+            return self._team_priority.to_team_priority()
+        return self._team_priority
+
+    def _create_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        if self._team_priority is None:
+            return precedence.CriticalPathAnalysis.create_from_graph(self._num_teams, self._G)
+        # A PriorityArray is passed as is, since the adjacency is built from it without loops.
+        return precedence.CriticalPathAnalysis.create_from_team_priority(self._team_priority)
+
+    def iter_rounds(self) -> Iterator[list[opb.OpbNode]]:
+        """Yield the matches (i, j) (i < j) of each round, as soon as the round is determined
+
+        Each team keeps a pointer to its next opposing team, and a match is played
+        as soon as it is next for both teams, which is the same layering as solve().
+        Only the pointers and the matches of the current round are kept,
+        and the byes are implied (the teams not in the round have a bye).
+        This does not depend on solve().
+
+        Yields
+        -----
+        matches: list[opb.OpbNode]
+            The matches of the round in increasing order
+
+        Raises
+        -----
+        InfeasibleInstanceError
+            When no match can be played while some remain, i.e., the priority has a cycle
+            (after yielding the rounds determined until then)
+        """
+        team_priority = self._get_team_priority()
+        num_teams = self._num_teams
+        next_index = [0] * (num_teams + 1)
+
+        def _ready_match(i: int) -> opb.OpbNode | None:
+            if next_index[i] == num_teams - 1:
+                return None
+            j = team_priority[i][next_index[i]]
+            if next_index[j] == num_teams - 1 or team_priority[j][next_index[j]] != i:
+                return None
+            return (i, j) if i < j else (j, i)
+
+        num_remaining = num_teams * (num_teams - 1) // 2
+        ready = {match for i in range(1, num_teams + 1) if (match := _ready_match(i)) is not None}
+        while num_remaining > 0:
+            if not ready:
+                raise opb.ERRORS[opb.INFEASIBLE]
+            matches = sorted(ready)
+            num_remaining -= len(matches)
+            for i, j in matches:
+                next_index[i] += 1
+                next_index[j] += 1
+            # Only the teams which have just played can have a new ready match.
+            ready = {match for i, j in matches for t in (i, j) if (match := _ready_match(t)) is not None}
+            yield matches
+
+    def iter_optimal_schedules(
+        self, limit: int | None = None, seed: int | np.random.Generator | None = None
+    ) -> Iterator[opb.Schedule]:
+        """Yield every distinct schedule with the minimum number of rounds, one at a time
+
+        The matches are assigned rounds in topological order by backtracking.
+        Each match takes a round after all its predecessors within its slack window
+        (up to the latest round of the critical path analytics), so the window is never empty
+        and every branch ends in a schedule. Only the current branch is kept in memory.
+        This does not depend on solve().
+
+        Parameters
+        -----
+        limit: int | None, optional (default = None)
+            The maximum number of schedules to yield (all if None)
+
+        seed: int | np.random.Generator | None, optional (default = None)
+            If None, the rounds in each window are tried in increasing order,
+            so the first schedule is the one of solve().
+            Otherwise, they are tried in a random order.
+
+        Yields
+        -----
+        schedule: opb.Schedule
+            A schedule with the minimum number of rounds
+
+        Raises
+        -----
+        InfeasibleInstanceError
+            If the team priority has a cycle
+        """
+        analysis = self.get_critical_path_analysis()
+        num_rounds = analysis.get_lower_bound()  # raises InfeasibleInstanceError if cyclic
+        matches = analysis.get_matches()
+        pred = analysis.get_adjacency()[0].tolist()
+        latest = analysis.get_latest_rounds(num_rounds).tolist()
+        earliest = analysis.get_earliest_rounds().tolist()
+        order = sorted(range(len(matches)), key=lambda u: earliest[u])  # a topological order
+        rng = None if seed is None else np.random.default_rng(seed)
+
+        def _window(u: int) -> list[int]:
+            first = 1 + max([0] + [round_of[v] for v in pred[u] if v >= 0])
+            rounds = list(range(latest[u], first - 1, -1))  # popped from the end
+            if rng is not None:
+                rng.shuffle(rounds)
+            return rounds
+
+        cnt = 0
+        round_of = [0] * len(matches)
+        stack = [_window(order[0])] if order else []
+        while stack and (limit is None or cnt < limit):
+            if not stack[-1]:
+                stack.pop()
+                continue
+            round_of[order[len(stack) - 1]] = stack[-1].pop()
+            if len(stack) < len(order):
+                stack.append(_window(order[len(stack)]))
+                continue
+            schedule = {t: {r: opb.BYES for r in range(1, num_rounds + 1)} for t in range(1, self._num_teams + 1)}
+            for (i, j), r in zip(matches, round_of):
+                schedule[i][r] = j
+                schedule[j][r] = i
+            cnt += 1
+            yield schedule
+
     def _is_feasible(self) -> bool:
         try:
             list(nx.topological_sort(self._G))
@@ -157,17 +323,20 @@ class TopologicalSortAlgorithm(OptByesAlgorithm):
         self._status = opb.OPTIMAL
         self._schedule = {i: {} for i in range(1, self._num_teams + 1)}
 
+        # The layering removes the nodes, so it works on a copy,
+        # and self._G stays for iter_rounds() and the analytics.
+        G = self._G.copy()
         num_round = 1
-        while len(self._G) != 0:
+        while len(G) != 0:
             for i in range(1, self._num_teams + 1):
                 self._schedule[i][num_round] = opb.BYES  # initialize BYES
-            for node, indegree in list(self._G.in_degree()):  # type: ignore
+            for node, indegree in list(G.in_degree()):  # type: ignore
                 if indegree != 0:
                     continue
                 team_i, team_j = node  # node: opb.OpbNode = tuple[int, int]
                 self._schedule[team_i][num_round] = team_j
                 self._schedule[team_j][num_round] = team_i
-                self._G.remove_node(node)
+                G.remove_node(node)
             num_round += 1
 
 
@@ -177,6 +346,17 @@ class IterateNumRoundsAlgorithm(OptByesAlgorithm):
     This algorithm solves the base problem by iterating the number of rounds,
     and check whether the instance is feasible or not,
     if so, how many rounds can be achieved.
+
+    The iteration starts from the critical path length R of the match precedence graph,
+    which is feasible with the shipped factories (play each match as early as possible),
+    so R is always solved first in this process.
+
+    With num_workers > 1, if R is infeasible (possible only with a custom factory),
+    the problems for R + 1, ..., R + num_workers are solved speculatively at once in worker processes
+    (started with the "spawn" method, so prob_factory must be picklable).
+    Since a schedule with R rounds is also feasible with R + 1 rounds (add an empty round),
+    an infeasible R proves every smaller R infeasible,
+    and a feasible R makes every larger R unnecessary, so those workers are terminated.
     """
 
     def __init__(self) -> None:
@@ -185,23 +365,28 @@ class IterateNumRoundsAlgorithm(OptByesAlgorithm):
         self._num_rounds: int
         self._tp_array: opb.TeamPriorityArray
         self._prob_factory: opb.ILPFactory
+        self._num_workers: int = 1
 
     @classmethod
     def create_from_team_priority(
-        cls, team_priority: opb.TeamPriority, prob_factory: opb.ILPFactory
+        cls, team_priority: TeamPriorityLike, prob_factory: opb.ILPFactory, num_workers: int = 1
     ) -> IterateNumRoundsAlgorithm:
         """Create instances of algorithm from team_priority
 
         Parameters
         -----
-        team_priority: opb.TeamPriority
-            A dictionary of the team's desired priority order
+        team_priority: TeamPriorityLike
+            A dictionary of the team's desired priority order (or its PriorityArray)
 
         prob_factory: opb.ProblemFactory
             The type of integer programming model to create.
             The problem is dynamically generated as it is solved multiple times
             while changing the number of rounds.
 
+        num_workers: int, optional (default = 1)
+            The number of worker processes solving different numbers of rounds at once.
+            If 1, the numbers of rounds are solved one by one in this process.
+
         Returns
         -----
         algorithm: IterateNumRoundsAlgorithm
@@ -209,30 +394,498 @@ class IterateNumRoundsAlgorithm(OptByesAlgorithm):
         """
         algorithm = cls()
         algorithm._num_teams = len(team_priority)
-        algorithm._num_rounds = len(team_priority) - 1
+        # Start from the critical path length of the precedence graph,
+        # since no smaller number of rounds is feasible.
+        analysis = precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+        algorithm._analysis = analysis
+        if not analysis.is_acyclic():  # The graph has a cycle, so no number of rounds is feasible.
+            algorithm._num_rounds = int(special.comb(algorithm._num_teams, 2, exact=True)) + 1
+        else:
+            algorithm._num_rounds = max(len(team_priority) - 1, analysis.get_lower_bound())
         tp_array = converter.convert_team_priority_to_team_priority_array(team_priority)
         algorithm._tp_array = tp_array
         algorithm._prob_factory = prob_factory
+        if num_workers < 1:
+            raise ValueError("num_workers must be positive.")
+        algorithm._num_workers = num_workers
         return algorithm
 
+    def _create_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        team_priority = converter.convert_team_priority_array_to_team_priority(self._num_teams, self._tp_array)
+        return precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+
+    def _solve_num_rounds(self) -> bool:
+        """Solve the problem with self._num_rounds in this process and return whether it is feasible"""
+        print(f"{self.COLOR_RED}num_rounds = {self._num_rounds}{self.COLOR_NAN}")
+        prob = self._prob_factory.create_with_analysis(
+            self._num_teams, self._num_rounds, self._tp_array, self.get_critical_path_analysis()
+        )
+        prob.solve()
+        if prob.get_status() != opb.OPTIMAL:
+            return False
+        self._status = opb.OPTIMAL
+        self._schedule = prob.get_schedule()
+        return True
+
     def solve(self) -> None:
-        infeasible_flag = True
         max_round = int(special.comb(self._num_teams, 2, exact=True))
         while self._num_rounds <= max_round:
-            print(f"{self.COLOR_RED}num_rounds = {self._num_rounds}{self.COLOR_NAN}")
-            prob = self._prob_factory.create(self._num_teams, self._num_rounds, self._tp_array)
-            prob.solve()
             # Once the optimal solution is found,
             # the optimal schedule is saved and terminated.
-            if prob.get_status() == opb.OPTIMAL:
-                self._status = opb.OPTIMAL
-                self._schedule = prob.get_schedule()
-                infeasible_flag = False
-                break
+            if self._solve_num_rounds():
+                return
             # If an optimal solution is not found,
             # increase the self._num_rounds.
             self._num_rounds += 1
-        # If self._num_rounds are increased up to 2n - 1 and the Problem is still infeasible,
+            # The first number of rounds (the lower bound) is solved in this process,
+            # since starting the workers costs far more than solving it,
+            # and the workers only speculate on the larger ones.
+            if self._num_workers > 1:
+                self._solve_in_parallel()
+                return
+        # If self._num_rounds are increased up to n(n - 1) / 2 and the Problem is still infeasible,
         # it is considered to be INFEASIBLE.
-        if infeasible_flag:
+        self._status = opb.INFEASIBLE
+
+    def _solve_in_parallel(self) -> None:
+        max_round = int(special.comb(self._num_teams, 2, exact=True))
+        # Every R <= infeasible_round is infeasible, and feasible_round is the smallest feasible R found.
+        infeasible_round = self._num_rounds - 1
+        feasible_round = max_round + 1
+        schedules: dict[int, opb.Schedule] = {}
+        workers: dict[int, tuple[BaseProcess, Connection]] = {}
+        next_round = self._num_rounds
+        try:
+            while feasible_round - infeasible_round > 1:
+                # Keep the workers busy with the undecided numbers of rounds, smallest first.
+                next_round = max(next_round, infeasible_round + 1)
+                while len(workers) < self._num_workers and next_round < feasible_round:
+                    print(f"{self.COLOR_RED}num_rounds = {next_round}{self.COLOR_NAN}")
+                    workers[next_round] = self._start_worker(next_round)
+                    next_round += 1
+                if not workers:
+                    break
+
+                ready = wait([conn for _, conn in workers.values()])[0]
+                num_rounds = next(r for r, (_, conn) in workers.items() if conn is ready)
+                status, schedule = self._receive_result(num_rounds, *workers.pop(num_rounds))
+                if status == opb.OPTIMAL:
+                    feasible_round = min(feasible_round, num_rounds)
+                    schedules[num_rounds] = schedule
+                else:
+                    infeasible_round = max(infeasible_round, num_rounds)
+
+                # Cancel the workers which can no longer change the answer.
+                for r in [r for r in workers if not infeasible_round < r < feasible_round]:
+                    self._stop_worker(*workers.pop(r))
+        finally:
+            for process, conn in workers.values():
+                self._stop_worker(process, conn)
+
+        if feasible_round > max_round:
+            self._num_rounds = max_round + 1
+            self._status = opb.INFEASIBLE
+            return
+        self._num_rounds = feasible_round
+        self._status = opb.OPTIMAL
+        self._schedule = schedules[feasible_round]
+
+    def _start_worker(self, num_rounds: int) -> tuple[BaseProcess, Connection]:
+        # Gurobi does not support fork() after an environment (or a cached model) has been created,
+        # so each worker starts a fresh interpreter.
+        ctx = multiprocessing.get_context("spawn")
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_solve_ilp_in_worker,
+            args=(
+                self._prob_factory,
+                self._num_teams,
+                num_rounds,
+                self._tp_array,
+                self.get_critical_path_analysis(),
+                send_conn,
+            ),
+            daemon=True,
+        )
+        process.start()
+        send_conn.close()
+        return process, recv_conn
+
+    @staticmethod
+    def _receive_result(num_rounds: int, process: BaseProcess, conn: Connection) -> tuple[opb.Status, opb.Schedule]:
+        """Receive (status, schedule) from the finished worker, raising the exception of the worker"""
+        try:
+            result: tuple[opb.Status | Exception, opb.Schedule] = conn.recv()
+            status, schedule = result
+        except EOFError:
+            raise RuntimeError(f"The worker solving num_rounds = {num_rounds} died.") from None
+        finally:
+            conn.close()
+            process.join()
+        if isinstance(status, BaseException):
+            raise status
+        return status, schedule
+
+    @staticmethod
+    def _stop_worker(process: BaseProcess, conn: Connection) -> None:
+        process.terminate()
+        process.join()
+        conn.close()
+
+
+def _solve_ilp_in_worker(
+    prob_factory: opb.ILPFactory,
+    num_teams: int,
+    num_rounds: int,
+    tp_array: opb.TeamPriorityArray,
+    analysis: precedence.CriticalPathAnalysis,
+    conn: Connection,
+) -> None:
+    """Solve the problem with num_rounds and send (status, schedule) back (or (exception, {}))"""
+    try:
+        prob = prob_factory.create_with_analysis(num_teams, num_rounds, tp_array, analysis)
+        prob.solve()
+        status = prob.get_status()
+        conn.send((status, prob.get_schedule() if status == opb.OPTIMAL else {}))
+    except Exception as e:
+        conn.send((e, {}))
+    finally:
+        conn.close()
+
+
+class MinRoundsAlgorithm(OptByesAlgorithm):
+    """Solve the base problem by minimizing the number of rounds at once
+
+    This algorithm solves the base problem with a single optimization of MinRoundsILP
+    over the maximum horizon num_teams * (num_teams - 1) / 2,
+    and check whether the instance is feasible or not,
+    if so, how many rounds can be achieved.
+    MinRoundsILP belongs to the BaseILP family, so it uses the parameters tuned for BaseILPFactory.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._num_teams: int
+        self._tp_array: opb.TeamPriorityArray
+        self._params: opb.GurobiParams | None = None
+        self._tuned_params: str | Path | None = None
+
+    @classmethod
+    def create_from_team_priority(
+        cls,
+        team_priority: TeamPriorityLike,
+        params: opb.GurobiParams | None = None,
+        tuned_params: str | Path | None = None,
+    ) -> MinRoundsAlgorithm:
+        """Create instances of algorithm from team_priority
+
+        Parameters
+        -----
+        team_priority: TeamPriorityLike
+            A dictionary of the team's desired priority order (or its PriorityArray)
+
+        params: opb.GurobiParams | None, optional (default = None)
+            The Gurobi parameters of MinRoundsILP (see ILPFactory)
+
+        tuned_params: str | Path | None, optional (default = None)
+            A tuned parameter file to load the parameters of BaseILPFactory from (see ILPFactory)
+
+        Returns
+        -----
+        algorithm: MinRoundsAlgorithm
+            return this
+        """
+        algorithm = cls()
+        algorithm._num_teams = len(team_priority)
+        algorithm._tp_array = converter.convert_team_priority_to_team_priority_array(team_priority)
+        algorithm._params = params
+        algorithm._tuned_params = tuned_params
+        return algorithm
+
+    def _create_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        team_priority = converter.convert_team_priority_array_to_team_priority(self._num_teams, self._tp_array)
+        return precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+
+    def solve(self) -> None:
+        max_round = int(special.comb(self._num_teams, 2, exact=True))
+        prob = opb.MinRoundsILP(
+            self._num_teams,
+            max_round,
+            self._tp_array,
+            opb.SHARED_TEMPLATE_CACHE,
+            analysis=self.get_critical_path_analysis(),
+        )
+        prob.set_params(opb.resolve_params("BaseILPFactory", self._num_teams, self._params, self._tuned_params))
+        prob.solve()
+        self._status = prob.get_status()
+        if self._status == opb.OPTIMAL:
+            self._schedule = prob.get_schedule()
+
+
+class UnavailableRoundsAlgorithm(OptByesAlgorithm):
+    """Solve the base problem where teams have unavailable (blackout) rounds
+
+    A match only has to wait for its predecessors in the match precedence graph
+    (the previous matches of its teams) and for a round in which both of its teams are available.
+    So every match is played in its earliest such round, in the topological order of the graph
+    (a list scheduling: in each round, every match that is next in the priorities of both teams is played,
+    unless one of the teams is unavailable in the round).
+    No match can be played earlier in any schedule, so the number of rounds is the minimum,
+    and rounds in which every team is unavailable are left empty.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._num_teams: int
+        self._team_priority: TeamPriorityLike
+        self._unavailable_rounds: opb.UnavailableRounds
+
+    @classmethod
+    def create_from_team_priority(
+        cls, team_priority: TeamPriorityLike, unavailable_rounds: opb.UnavailableRounds
+    ) -> UnavailableRoundsAlgorithm:
+        """Create instances of algorithm from team_priority
+
+        Parameters
+        -----
+        team_priority: TeamPriorityLike
+            A dictionary of the team's desired priority order (or its PriorityArray)
+
+        unavailable_rounds: opb.UnavailableRounds
+            The rounds in which each team can not play,
+            e.g., {1: {2, 3}} (team 1 can not play in rounds 2 and 3)
+
+        Returns
+        -----
+        algorithm: UnavailableRoundsAlgorithm
+            return this
+        """
+        for t, rounds in unavailable_rounds.items():
+            if t not in team_priority:
+                raise ValueError(f"Team {t} is not in team_priority.")
+            if any(r < 1 for r in rounds):
+                raise ValueError("Rounds must be positive.")
+        algorithm = cls()
+        algorithm._num_teams = len(team_priority)
+        algorithm._team_priority = team_priority
+        algorithm._unavailable_rounds = unavailable_rounds
+        return algorithm
+
+    def _create_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        return precedence.CriticalPathAnalysis.create_from_team_priority(self._team_priority)
+
+    def _get_earliest_rounds(self) -> np.ndarray:
+        """Return the earliest round of each match skipping the unavailable rounds
+
+        The rounds are in the order of get_matches().
+        """
+        analysis = self.get_critical_path_analysis()
+        matches = analysis.get_matches()
+        pred, _ = analysis.get_adjacency()
+        earliest = np.zeros(len(matches), dtype=np.int64)
+        # The predecessors of a match have smaller earliest rounds without the unavailable rounds.
+        for u in np.argsort(analysis.get_earliest_rounds(), kind="stable"):
+            i, j = matches[u]
+            unavailable_i = self._unavailable_rounds.get(i, ())
+            unavailable_j = self._unavailable_rounds.get(j, ())
+            r = max((int(earliest[v]) for v in pred[u] if v >= 0), default=0) + 1
+            while r in unavailable_i or r in unavailable_j:
+                r += 1
+            earliest[u] = r
+        return earliest
+
+    def _lower_bound(self, earliest: np.ndarray) -> int:
+        """The last earliest round, which no schedule can beat"""
+        return int(earliest.max(initial=0))
+
+    def solve(self) -> None:
+        if not self.get_critical_path_analysis().is_acyclic():
+            self._status = opb.INFEASIBLE
+            return
+
+        earliest = self._get_earliest_rounds()
+        num_rounds = self._lower_bound(earliest)
+        teams = range(1, self._num_teams + 1)
+        schedule: opb.Schedule = {t: {r: opb.BYES for r in range(1, num_rounds + 1)} for t in teams}
+        for (i, j), r in zip(self.get_critical_path_analysis().get_matches(), earliest):
+            schedule[i][int(r)] = j
+            schedule[j][int(r)] = i
+        self._status = opb.OPTIMAL
+        self._schedule = schedule
+
+
+class ReschedulingAlgorithm(OptByesAlgorithm):
+    """Repair a schedule when teams change their priorities mid-season
+
+    The matches played in the first num_played rounds are frozen.
+    When a team changes the order of its remaining opposing teams,
+    only the precedence edges of that team change, so only the matches reachable from
+    its unplayed matches are re-layered (each as early as possible after its predecessors),
+    in time proportional to the size of that downstream part.
+    The changes given before solve() are applied as a batch, which is all-or-nothing:
+    if one of them creates a cycle, the whole batch is rolled back and the cycle is kept as a certificate.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._num_teams: int
+        self._order: dict[int, list[int]]
+        self._position: dict[int, dict[int, int]]
+        self._round_of: dict[opb.OpbNode, int]
+        self._updates: list[tuple[int, opb.OpposingTeams, int]] = []
+        self._cycle: list[opb.OpbNode] = []
+
+    @classmethod
+    def create_from_schedule(cls, team_priority: TeamPriorityLike, schedule: opb.Schedule) -> ReschedulingAlgorithm:
+        """Create instances of algorithm from team_priority and its schedule
+
+        Parameters
+        -----
+        team_priority: TeamPriorityLike
+            A dictionary of the team's desired priority order (or its PriorityArray)
+
+        schedule: opb.Schedule
+            A schedule respecting team_priority, e.g., by TopologicalSortAlgorithm
+
+        Returns
+        -----
+        algorithm: ReschedulingAlgorithm
+            return this
+        """
+        algorithm = cls()
+        algorithm._num_teams = len(team_priority)
+        algorithm._order = {t: list(opposing_teams) for t, opposing_teams in team_priority.items()}
+        algorithm._position = {t: {j: a for a, j in enumerate(order)} for t, order in algorithm._order.items()}
+        algorithm._round_of = {}
+        for i, opposing_teams in schedule.items():
+            for r, j in opposing_teams.items():
+                if j != opb.BYES and i < j:
+                    algorithm._round_of[i, j] = r
+        if len(algorithm._round_of) != algorithm._num_teams * (algorithm._num_teams - 1) // 2:
+            raise ValueError("Every pair of teams must play once in the schedule.")
+        return algorithm
+
+    def update_team_priority(self, team: int, opposing_teams: opb.OpposingTeams, num_played: int) -> None:
+        """Change the priority of the team after num_played rounds (applied by solve())
+
+        Parameters
+        -----
+        team: int
+            The team changing its priority
+
+        opposing_teams: opb.OpposingTeams
+            The new priority of the team. The opposing teams already played must stay in front.
+
+        num_played: int
+            The number of rounds already played
+
+        Notes
+        -----
+        solve() applies all pending changes together. If one of them is rejected (by a cycle or a ValueError),
+        none of them is applied and they are discarded, so the priorities and the schedule stay as before.
+        """
+        self._updates.append((team, tuple(opposing_teams), num_played))
+        self._status = opb.LOADED
+
+    def _create_critical_path_analysis(self) -> precedence.CriticalPathAnalysis:
+        # The analytics of the current priorities, regardless of the rounds already played
+        team_priority = {t: tuple(order) for t, order in self._order.items()}
+        return precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+
+    def get_cycle(self) -> list[opb.OpbNode]:
+        """Return the cycle of matches created by the rejected priority ([] if feasible)"""
+        return self._cycle
+
+    @staticmethod
+    def _match(i: int, j: int) -> opb.OpbNode:
+        return (i, j) if i < j else (j, i)
+
+    def _neighbors(self, node: opb.OpbNode, step: int) -> list[opb.OpbNode]:
+        """Predecessors (step = -1) or successors (step = 1) of the match"""
+        neighbors = []
+        for i, j in [node, node[::-1]]:
+            a = self._position[i][j] + step
+            if 0 <= a < self._num_teams - 1:
+                neighbors.append(self._match(i, self._order[i][a]))
+        return neighbors
+
+    def _set_order(self, team: int, opposing_teams: list[int]) -> None:
+        self._order[team] = opposing_teams
+        self._position[team] = {j: a for a, j in enumerate(opposing_teams)}
+
+    def _find_cycle(self, remaining: set[opb.OpbNode]) -> list[opb.OpbNode]:
+        # Every remaining match has a remaining predecessor, so walking back must repeat a match.
+        path: list[opb.OpbNode] = []
+        visited: dict[opb.OpbNode, int] = {}
+        node = next(iter(remaining))
+        while node not in visited:
+            visited[node] = len(path)
+            path.append(node)
+            node = next(pred for pred in self._neighbors(node, -1) if pred in remaining)
+        return path[visited[node] :][::-1]
+
+    def _apply_update(self, team: int, opposing_teams: opb.OpposingTeams, num_played: int) -> bool:
+        old_order = self._order[team]
+        if sorted(opposing_teams) != sorted(old_order):
+            raise ValueError(f"The new priority of team {team} must contain each opposing team once.")
+        num_team_played = sum(1 for j in old_order if self._round_of[self._match(team, j)] <= num_played)
+        if list(opposing_teams[:num_team_played]) != old_order[:num_team_played]:
+            raise ValueError(f"The opposing teams already played by team {team} can not be reordered.")
+        self._set_order(team, list(opposing_teams))
+
+        # 1. Collect the matches downstream of the unplayed matches of the team.
+        affected = {self._match(team, j) for j in opposing_teams[num_team_played:]}
+        stack = list(affected)
+        while stack:
+            for succ in self._neighbors(stack.pop(), 1):
+                if succ not in affected:
+                    affected.add(succ)
+                    stack.append(succ)
+
+        # 2. Re-layer them in topological order.
+        indegree = {node: sum(1 for pred in self._neighbors(node, -1) if pred in affected) for node in affected}
+        stack = [node for node, d in indegree.items() if d == 0]
+        new_round_of: dict[opb.OpbNode, int] = {}
+        while stack:
+            node = stack.pop()
+            preds = self._neighbors(node, -1)
+            new_round_of[node] = 1 + max(
+                [num_played] + [new_round_of[pred] if pred in affected else self._round_of[pred] for pred in preds]
+            )
+            for succ in self._neighbors(node, 1):
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    stack.append(succ)
+
+        # 3. Roll back if the new priority creates a cycle.
+        if len(new_round_of) != len(affected):
+            self._cycle = self._find_cycle(affected - new_round_of.keys())
+            self._set_order(team, old_order)
+            return False
+        self._round_of.update(new_round_of)
+        return True
+
+    def solve(self) -> None:
+        self._cycle = []
+        self._analysis = None
+        updates, self._updates = self._updates, []
+        # _set_order() replaces the lists of a team, so shallow copies keep the state before the batch.
+        snapshot = (dict(self._order), dict(self._position), dict(self._round_of))
+        try:
+            accepted = all(
+                self._apply_update(team, opposing_teams, num_played) for team, opposing_teams, num_played in updates
+            )
+        except ValueError:
+            self._order, self._position, self._round_of = snapshot
+            raise
+        if not accepted:
+            self._order, self._position, self._round_of = snapshot
             self._status = opb.INFEASIBLE
+            return
+
+        self._status = opb.OPTIMAL
+        num_rounds = max(self._round_of.values())
+        self._schedule = {i: {r: opb.BYES for r in range(1, num_rounds + 1)} for i in range(1, self._num_teams + 1)}
+        for (i, j), r in self._round_of.items():
+            self._schedule[i][r] = j
+            self._schedule[j][r] = i
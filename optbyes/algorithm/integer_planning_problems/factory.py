@@ -1,19 +1,120 @@
+import inspect
 from abc import ABCMeta, abstractmethod
+from pathlib import Path
+from typing import final
 
 import optbyes as opb
+from optbyes.algorithm.integer_planning_problems import tuning
+from optbyes.utils import precedence
 
 __all__ = [
     "ILPFactory",
     "BaseILPFactory",
+    "RoundIndexILPFactory",
 ]
 
 
 class ILPFactory(metaclass=ABCMeta):
+    """A base class for the factories of ILP
+
+    analysis is the critical path analytics of the team priority of tp_array,
+    which the problems may reuse instead of computing it again (see BaseILP).
+
+    Parameters
+    -----
+    params: opb.GurobiParams | None, optional (default = None)
+        The Gurobi parameters of the created problems (the Gurobi defaults if None)
+
+    tuned_params: str | Path | None, optional (default = None)
+        A tuned parameter file (see optbyes tuning, e.g., opb.get_tuned_params_path()),
+        from which the parameters tuned for the factory and num_teams are loaded
+        (params take precedence over them). If None, the file in OPTBYES_TUNED_PARAMS is used if it is set,
+        and nothing is loaded if not (see opb.resolve_params()).
+    """
+
+    def __init__(self, params: opb.GurobiParams | None = None, tuned_params: str | Path | None = None) -> None:
+        self._params = params
+        self._tuned_params = tuned_params
+
+    def _get_params(self, num_teams: int) -> opb.GurobiParams:
+        return tuning.resolve_params(type(self).__name__, num_teams, self._params, self._tuned_params)
+
     @abstractmethod
-    def create(self, num_teams: int, num_rounds: int, tp_array: opb.TeamPriorityArray) -> opb.ILP:
+    def create(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        tp_array: opb.TeamPriorityArray,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> opb.ILP:
         raise NotImplementedError()
 
+    @final
+    def create_with_analysis(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        tp_array: opb.TeamPriorityArray,
+        analysis: precedence.CriticalPathAnalysis | None,
+    ) -> opb.ILP:
+        """Create the problem, passing analysis only if create() takes it
+
+        The factories written before analysis was added implement create(num_teams, num_rounds, tp_array).
+        """
+        if "analysis" in inspect.signature(self.create).parameters:
+            return self.create(num_teams, num_rounds, tp_array, analysis=analysis)
+        return self.create(num_teams, num_rounds, tp_array)
+
 
 class BaseILPFactory(ILPFactory):
-    def create(self, num_teams: int, num_rounds: int, tp_array: opb.TeamPriorityArray) -> opb.BaseILP:
-        return opb.BaseILP(num_teams, num_rounds, tp_array)
+    """Create BaseILP sharing the profile-independent part of the models
+
+    Parameters
+    -----
+    template_cache: opb.ILPTemplateCache | None, optional (default = opb.SHARED_TEMPLATE_CACHE)
+        The cache of the model templates. If None, every model is built from scratch.
+
+    presolve: bool, optional (default = True)
+        Whether to fix the variables outside the time windows of the matches (see BaseILP)
+
+    params: opb.GurobiParams | None, optional (default = None)
+        The Gurobi parameters (see ILPFactory)
+
+    tuned_params: str | Path | None, optional (default = None)
+        A tuned parameter file to load the parameters from (see ILPFactory)
+    """
+
+    def __init__(
+        self,
+        template_cache: opb.ILPTemplateCache | None = opb.SHARED_TEMPLATE_CACHE,
+        presolve: bool = True,
+        params: opb.GurobiParams | None = None,
+        tuned_params: str | Path | None = None,
+    ) -> None:
+        super().__init__(params, tuned_params)
+        self._template_cache = template_cache
+        self._presolve = presolve
+
+    def create(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        tp_array: opb.TeamPriorityArray,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> opb.BaseILP:
+        prob = opb.BaseILP(num_teams, num_rounds, tp_array, self._template_cache, self._presolve, analysis)
+        prob.set_params(self._get_params(num_teams))
+        return prob
+
+
+class RoundIndexILPFactory(ILPFactory):
+    def create(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        tp_array: opb.TeamPriorityArray,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> opb.RoundIndexILP:
+        prob = opb.RoundIndexILP(num_teams, num_rounds, tp_array)
+        prob.set_params(self._get_params(num_teams))
+        return prob
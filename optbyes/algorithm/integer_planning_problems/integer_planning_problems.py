@@ -4,10 +4,14 @@ from typing import final
 import gurobipy as gp
 
 import optbyes as opb
+from optbyes.utils import converter, precedence
 
 __all__ = [
     "ILP",
     "BaseILP",
+    "MinRoundsILP",
+    "UnavailableRoundsILP",
+    "RoundIndexILP",
 ]
 
 
@@ -36,6 +40,8 @@ class ILP(metaclass=ABCMeta):
         self._tp_array = team_priority_array
         self._status: int = opb.LOADED
         self._schedule: opb.Schedule = {}
+        self._model: gp.Model
+        self._params: opb.GurobiParams = {}
 
     @abstractmethod
     def _create_variables(self) -> None:
@@ -70,6 +76,22 @@ class ILP(metaclass=ABCMeta):
             raise opb.ERRORS[self._status]
         return self._schedule
 
+    @final
+    def set_params(self, params: opb.GurobiParams) -> None:
+        """Set the Gurobi parameters (e.g., {"MIPFocus": 1}) applied when the model is optimized"""
+        self._params = dict(params)
+
+    @final
+    def _set_model_params(self) -> None:
+        for name, value in self._params.items():
+            self._model.setParam(name, value)
+
+    @final
+    def get_model_size(self) -> tuple[int, int]:
+        """Return the number of variables and constraints of the model"""
+        self._model.update()
+        return self._model.NumVars, self._model.NumConstrs
+
 
 class BaseILP(ILP):
     """Modeler and Solver for Base Byes Problem
@@ -88,17 +110,71 @@ class BaseILP(ILP):
     team_priority_array: opb.TeamPriorityArray
         Parameters such that 1 if team k plays team i before team j
         (team_priority_array[k, i, j] = 1), 0 otherwise.
+
+    template_cache: opb.ILPTemplateCache | None, optional (default = None)
+        The cache of the model templates. If None, the model is built from scratch.
+
+    presolve: bool, optional (default = True)
+        Whether to fix x[i, j, r] = 0 outside the time window of the match (i, j).
+        The window is [the longest path from a source, num_rounds - the longest path to a sink + 1]
+        in the match precedence graph, and an empty window (or a cycle) proves infeasibility without Gurobi.
+
+    analysis: precedence.CriticalPathAnalysis | None, optional (default = None)
+        The critical path analytics of the team priority used by the presolve.
+        If None, it is computed from team_priority_array.
+        Pass it when the same team priority is solved several times (e.g., for different num_rounds).
     """
 
     NAME = "BaseILP"
 
-    def __init__(self, num_teams: int, num_rounds: int, team_priority_array: opb.TeamPriorityArray) -> None:
+    def __init__(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        team_priority_array: opb.TeamPriorityArray,
+        template_cache: opb.ILPTemplateCache | None = None,
+        presolve: bool = True,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> None:
         super().__init__(num_teams, num_rounds, team_priority_array)
+        self._template_cache = template_cache
+        self._from_template = False
+        self._presolve = presolve
+        self._analysis = analysis
+        self._infeasible_by_presolve = False
         self._model = gp.Model(self.NAME)
         self._xvar: dict[tuple[int, int, int], gp.Var] = {}
         self._yvar: dict[tuple[int, int], gp.Var] = {}
 
     def _create_variables(self) -> None:
+        if self._template_cache is None:
+            self._add_variables()
+            return
+        # Copy the profile-independent part (variables, constraints 1, 2, 3, 6 and the objective).
+        key = (self.NAME, self._num_teams, self._num_rounds)
+        self._model.dispose()
+        self._model = self._template_cache.clone(key, self._build_template)
+        self._from_template = True
+        for var in self._model.getVars():
+            self._lookup_variable(var.VarName.split("_"), var)
+
+    def _build_template(self) -> gp.Model:
+        self._model = gp.Model(self.NAME)
+        self._add_variables()
+        self._create_structural_constraints()
+        self._create_objective_function()
+        return self._model
+
+    def _lookup_variable(self, name: list[str], var: gp.Var) -> None:
+        prefix, *indices = name
+        if prefix == "x":
+            i, j, r = map(int, indices)
+            self._xvar[i, j, r] = var
+        elif prefix == "y":
+            i, r = map(int, indices)
+            self._yvar[i, r] = var
+
+    def _add_variables(self) -> None:
         for i in range(1, self._num_teams + 1):
             for j in range(1, self._num_teams + 1):
                 for r in range(1, self._num_rounds + 1):
@@ -109,12 +185,47 @@ class BaseILP(ILP):
                 self._yvar[i, r] = self._model.addVar(vtype="B", name=f"y_{i}_{r}")
 
     def _create_constraint_functions(self) -> None:
+        if not self._from_template:
+            self._create_structural_constraints()
+        self._create_profile_constraints()
+
+    def _create_structural_constraints(self) -> None:
+        """Constraints depending only on (num_teams, num_rounds)"""
         self._constraint_function_1()
         self._constraint_function_2()
         self._constraint_function_3()
+        self._constraint_function_6()
+
+    def _create_profile_constraints(self) -> None:
+        """Constraints reading team_priority_array"""
+        if self._presolve:
+            self._fix_variables_outside_time_windows()
+            if self._infeasible_by_presolve:
+                return
         self._constraint_function_4()
         self._constraint_function_5()
-        self._constraint_function_6()
+
+    def _fix_variables_outside_time_windows(self) -> None:
+        if self._analysis is None:
+            team_priority = converter.convert_team_priority_array_to_team_priority(self._num_teams, self._tp_array)
+            self._analysis = precedence.CriticalPathAnalysis.create_from_team_priority(team_priority)
+        if not self._analysis.is_acyclic():
+            self._infeasible_by_presolve = True
+            return
+        earliest = self._analysis.get_earliest_rounds()
+        latest = self._analysis.get_latest_rounds(self._num_rounds)
+        if (earliest > latest).any():
+            self._infeasible_by_presolve = True
+            return
+
+        u = 0
+        for i in range(1, self._num_teams):
+            for j in range(i + 1, self._num_teams + 1):
+                for r in range(1, self._num_rounds + 1):
+                    if not earliest[u] <= r <= latest[u]:
+                        self._xvar[i, j, r].UB = 0
+                        self._xvar[j, i, r].UB = 0
+                u += 1
 
     def _constraint_function_1(self) -> None:
         for r in range(1, self._num_rounds + 1):
@@ -160,12 +271,18 @@ class BaseILP(ILP):
                 self._model.addConstr(c <= 1)
 
     def _create_objective_function(self) -> None:
+        if self._from_template:
+            return
         obj = gp.quicksum(
             self._yvar[i, r] for i in range(1, self._num_teams + 1) for r in range(1, self._num_rounds + 1)
         )
         self._model.setObjective(obj, gp.GRB.MINIMIZE)
 
     def _optimize(self) -> None:
+        if self._infeasible_by_presolve:
+            self._status = opb.INFEASIBLE
+            return
+        self._set_model_params()
         self._model.optimize()
 
         # set status
@@ -184,3 +301,260 @@ class BaseILP(ILP):
                     if self._xvar[i, j, r].X == 1:
                         team_i[r] = j
             self._schedule[i] = team_i
+
+
+class MinRoundsILP(BaseILP):
+    """Modeler and Solver for Base Byes Problem minimizing the number of rounds
+
+    Solve with the Base Byes problem by Gurobi in a single optimization,
+    under the condition that num_rounds <= R (the horizon).
+    Round usage variables u[r] are added with the monotonicity u[r] <= u[r - 1],
+    and the number of used rounds sum(u[r]) is minimized.
+    Unused rounds can only be the last ones and every used round has at least one match,
+    which also breaks the symmetry of shifting matches into empty rounds.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    num_rounds: int
+        The horizon, the maximum number of rounds (e.g. num_teams * (num_teams - 1) / 2)
+
+    team_priority_array: opb.TeamPriorityArray
+        Parameters such that 1 if team k plays team i before team j
+        (team_priority_array[k, i, j] = 1), 0 otherwise.
+
+    template_cache: opb.ILPTemplateCache | None, optional (default = None)
+        The cache of the model templates
+
+    presolve: bool, optional (default = True)
+        Whether to fix the variables outside the time windows of the matches (see BaseILP)
+
+    analysis: precedence.CriticalPathAnalysis | None, optional (default = None)
+        The critical path analytics of the team priority used by the presolve (see BaseILP)
+    """
+
+    NAME = "MinRoundsILP"
+
+    def __init__(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        team_priority_array: opb.TeamPriorityArray,
+        template_cache: opb.ILPTemplateCache | None = None,
+        presolve: bool = True,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> None:
+        super().__init__(num_teams, num_rounds, team_priority_array, template_cache, presolve, analysis)
+        self._uvar: dict[int, gp.Var] = {}
+
+    def _lookup_variable(self, name: list[str], var: gp.Var) -> None:
+        super()._lookup_variable(name, var)
+        if name[0] == "u":
+            self._uvar[int(name[1])] = var
+
+    def _add_variables(self) -> None:
+        super()._add_variables()
+        for r in range(1, self._num_rounds + 1):
+            self._uvar[r] = self._model.addVar(vtype="B", name=f"u_{r}")
+
+    def _create_structural_constraints(self) -> None:
+        super()._create_structural_constraints()
+        self._constraint_function_7()
+        self._constraint_function_8()
+
+    def _constraint_function_7(self) -> None:
+        # round r is used => round r - 1 is used
+        for r in range(2, self._num_rounds + 1):
+            self._model.addConstr(self._uvar[r] <= self._uvar[r - 1])
+
+    def _constraint_function_8(self) -> None:
+        # Teams play only in used rounds, and every used round has at least one match.
+        for r in range(1, self._num_rounds + 1):
+            for i in range(1, self._num_teams + 1):
+                c = gp.quicksum(self._xvar[i, j, r] for j in range(1, self._num_teams + 1))
+                self._model.addConstr(c <= self._uvar[r])
+            c = gp.quicksum(
+                self._xvar[i, j, r] for i in range(1, self._num_teams) for j in range(i + 1, self._num_teams + 1)
+            )
+            self._model.addConstr(c >= self._uvar[r])
+
+    def _create_objective_function(self) -> None:
+        if self._from_template:
+            return
+        obj = gp.quicksum(self._uvar[r] for r in range(1, self._num_rounds + 1))
+        self._model.setObjective(obj, gp.GRB.MINIMIZE)
+
+    def _optimize(self) -> None:
+        super()._optimize()
+        if self._status != opb.OPTIMAL:
+            return
+
+        # drop unused rounds
+        num_used_rounds = round(self._model.ObjVal)
+        for t, opposing_teams in self._schedule.items():
+            self._schedule[t] = {r: j for r, j in opposing_teams.items() if r <= num_used_rounds}
+
+
+class UnavailableRoundsILP(MinRoundsILP):
+    """Modeler and Solver for Base Byes Problem with unavailable rounds of the teams
+
+    Solve with MinRoundsILP, where team i can not play in the rounds unavailable_rounds[i].
+    A used round may have no match (e.g., when every team is unavailable in it),
+    so only the unused rounds after the last used round are dropped.
+    A feasible schedule (e.g., by UnavailableRoundsAlgorithm) can be given as the incumbent.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    num_rounds: int
+        The horizon, the maximum number of rounds
+
+    team_priority_array: opb.TeamPriorityArray
+        Parameters such that 1 if team k plays team i before team j
+        (team_priority_array[k, i, j] = 1), 0 otherwise.
+
+    unavailable_rounds: opb.UnavailableRounds
+        The rounds in which each team can not play
+
+    incumbent: opb.Schedule | None, optional (default = None)
+        A feasible schedule within the horizon used as the MIP start
+
+    template_cache: opb.ILPTemplateCache | None, optional (default = None)
+        The cache of the model templates
+
+    presolve: bool, optional (default = True)
+        Whether to fix the variables outside the time windows of the matches (see BaseILP)
+
+    analysis: precedence.CriticalPathAnalysis | None, optional (default = None)
+        The critical path analytics of the team priority used by the presolve (see BaseILP)
+    """
+
+    NAME = "UnavailableRoundsILP"
+
+    def __init__(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        team_priority_array: opb.TeamPriorityArray,
+        unavailable_rounds: opb.UnavailableRounds,
+        incumbent: opb.Schedule | None = None,
+        template_cache: opb.ILPTemplateCache | None = None,
+        presolve: bool = True,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> None:
+        super().__init__(num_teams, num_rounds, team_priority_array, template_cache, presolve, analysis)
+        self._unavailable_rounds = unavailable_rounds
+        self._incumbent = incumbent
+
+    def _create_profile_constraints(self) -> None:
+        super()._create_profile_constraints()
+        self._constraint_function_9()
+        self._set_incumbent()
+
+    def _constraint_function_8(self) -> None:
+        # Teams play only in used rounds. Unlike MinRoundsILP, a used round may have no match,
+        # since the teams whose next matches are ready may all be unavailable in it.
+        for r in range(1, self._num_rounds + 1):
+            for i in range(1, self._num_teams + 1):
+                c = gp.quicksum(self._xvar[i, j, r] for j in range(1, self._num_teams + 1))
+                self._model.addConstr(c <= self._uvar[r])
+
+    def _constraint_function_9(self) -> None:
+        # team i plays no match in its unavailable rounds
+        for i, rounds in self._unavailable_rounds.items():
+            for r in rounds:
+                if r > self._num_rounds:
+                    continue
+                for j in range(1, self._num_teams + 1):
+                    self._xvar[i, j, r].UB = 0
+                    self._xvar[j, i, r].UB = 0
+
+    def _set_incumbent(self) -> None:
+        if self._incumbent is None:
+            return
+        for (i, j, r), var in self._xvar.items():
+            var.Start = 1 if self._incumbent[i].get(r) == j else 0
+        for (i, r), var in self._yvar.items():
+            var.Start = 1 if self._incumbent[i].get(r, opb.BYES) == opb.BYES else 0
+        num_incumbent_rounds = len(self._incumbent[1])
+        for r, var in self._uvar.items():
+            var.Start = 1 if r <= num_incumbent_rounds else 0
+
+
+class RoundIndexILP(ILP):
+    """Modeler and Solver for Base Byes Problem with round index variables
+
+    Solve with the Base Byes problem by Gurobi,
+    under the condition that num_rounds = R.
+    Instead of the time-indexed binaries x[i, j, r] of BaseILP,
+    each match (i, j) (i < j) gets one integer variable t[i, j] in [1, R], its round.
+    The priority of team k is expressed by difference constraints t[k, i] + 1 <= t[k, j]
+    between the consecutive opposing teams i and j of team k.
+
+    Because every team has a priority over all of its opposing teams,
+    these constraints order all matches of a team strictly,
+    so "one match per team per round" (the all-different constraint over the matches of a team)
+    is implied, and no disjunctive constraint is needed.
+    The model has O(n^2) variables and constraints regardless of R.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    num_rounds: int
+        The number of round ( >= num_teams - 1)
+
+    team_priority_array: opb.TeamPriorityArray
+        Parameters such that 1 if team k plays team i before team j
+        (team_priority_array[k, i, j] = 1), 0 otherwise.
+    """
+
+    NAME = "RoundIndexILP"
+
+    def __init__(self, num_teams: int, num_rounds: int, team_priority_array: opb.TeamPriorityArray) -> None:
+        super().__init__(num_teams, num_rounds, team_priority_array)
+        self._model = gp.Model(self.NAME)
+        self._tvar: dict[tuple[int, int], gp.Var] = {}
+
+    def _create_variables(self) -> None:
+        for i in range(1, self._num_teams):
+            for j in range(i + 1, self._num_teams + 1):
+                self._tvar[i, j] = self._model.addVar(lb=1, ub=self._num_rounds, vtype="I", name=f"t_{i}_{j}")
+
+    def _round_of(self, i: int, j: int) -> gp.Var:
+        return self._tvar[min(i, j), max(i, j)]
+
+    def _create_constraint_functions(self) -> None:
+        team_priority = converter.convert_team_priority_array_to_team_priority(self._num_teams, self._tp_array)
+        for k, opposing_teams in team_priority.items():
+            for i, j in zip(opposing_teams, opposing_teams[1:]):
+                self._model.addConstr(self._round_of(k, i) + 1 <= self._round_of(k, j))
+
+    def _create_objective_function(self) -> None:
+        # Any feasible solution has the same number of byes
+        # (num_teams * num_rounds - num_teams * (num_teams - 1)), so play each match as early as possible.
+        self._model.setObjective(gp.quicksum(self._tvar.values()), gp.GRB.MINIMIZE)
+
+    def _optimize(self) -> None:
+        self._set_model_params()
+        self._model.optimize()
+
+        # set status
+        if self._model.Status != gp.GRB.OPTIMAL:
+            self._status = opb.INFEASIBLE
+            return
+
+        # create schedule
+        self._status = opb.OPTIMAL
+        self._schedule = {
+            i: {r: opb.BYES for r in range(1, self._num_rounds + 1)} for i in range(1, self._num_teams + 1)
+        }
+        for (i, j), t in self._tvar.items():
+            r = round(t.X)
+            self._schedule[i][r] = j
+            self._schedule[j][r] = i
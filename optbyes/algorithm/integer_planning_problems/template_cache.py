@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import gurobipy as gp
+
+__all__ = [
+    "ILPTemplateCache",
+    "SHARED_TEMPLATE_CACHE",
+]
+
+
+class ILPTemplateCache:
+    """LRU cache of the profile-independent part of ILP models
+
+    The variables, the constraints and the objective function which depend only on
+    (num_teams, num_rounds) are built once as a template model, and each instance
+    gets a copy of it, to which only the rows reading the team priority are added.
+
+    Parameters
+    -----
+    maxsize: int, optional (default = 16)
+        The maximum number of templates. The least recently used template is disposed first.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive.")
+        self._maxsize = maxsize
+        self._templates: OrderedDict[Hashable, gp.Model] = OrderedDict()
+
+    def clone(self, key: Hashable, build: Callable[[], gp.Model]) -> gp.Model:
+        """Return a copy of the template model
+
+        Parameters
+        -----
+        key: Hashable
+            The key of the template, e.g., (model name, num_teams, num_rounds)
+
+        build: Callable[[], gp.Model]
+            The function to build the template when it is not cached
+
+        Returns
+        -----
+        model: gp.Model
+            A copy of the template model
+        """
+        template = self._templates.get(key)
+        if template is None:
+            template = build()
+            template.update()  # pending modifications are not copied
+            self._templates[key] = template
+            while len(self._templates) > self._maxsize:
+                _, evicted = self._templates.popitem(last=False)
+                evicted.dispose()
+        self._templates.move_to_end(key)
+        return template.copy()
+
+    def clear(self) -> None:
+        for template in self._templates.values():
+            template.dispose()
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Gurobi models can not be pickled, so a copy sent to another process starts empty.
+        return {"_maxsize": self._maxsize, "_templates": OrderedDict()}
+
+
+SHARED_TEMPLATE_CACHE = ILPTemplateCache()
@@ -1,5 +1,5 @@
 import optbyes as opb
-from optbyes.utils import converter
+from optbyes.utils import converter, generator
 
 
 def test_base_ilp_teams4_rounds5() -> None:
@@ -42,3 +42,14 @@ def test_base_problem_teams4_rounds6_2() -> None:
     prob2.solve()
     assert prob1.get_status() == opb.INFEASIBLE
     assert prob2.get_status() == opb.OPTIMAL
+
+
+def test_base_ilp_presolve() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+        for num_rounds in [3, 4, 5]:
+            prob1 = opb.BaseILP(4, num_rounds, tp_array, presolve=False)
+            prob2 = opb.BaseILP(4, num_rounds, tp_array, presolve=True)
+            prob1.solve()
+            prob2.solve()
+            assert prob1.get_status() == prob2.get_status()
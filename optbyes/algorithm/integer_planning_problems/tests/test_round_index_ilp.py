@@ -0,0 +1,30 @@
+import optbyes as opb
+from optbyes.utils import converter, generator
+
+
+def test_round_index_ilp_teams4_rounds5() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (2, 1, 4), 4: (2, 3, 1)}
+    tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+    num_teams = 4
+    prob1 = opb.RoundIndexILP(num_teams, 4, tp_array)
+    prob2 = opb.RoundIndexILP(num_teams, 5, tp_array)
+    prob1.solve()
+    prob2.solve()
+    assert prob1.get_status() == opb.INFEASIBLE
+    assert prob2.get_status() == opb.OPTIMAL
+    schedule = prob2.get_schedule()
+    assert sum(list(opposing_teams.values()).count(opb.BYES) for opposing_teams in schedule.values()) == 8
+
+
+def test_same_num_rounds_as_base_ilp() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        solvers = [
+            opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, factory)
+            for factory in [opb.BaseILPFactory(), opb.RoundIndexILPFactory()]
+        ]
+        for solver in solvers:
+            solver.solve()
+        assert solvers[0].get_status() == solvers[1].get_status()
+        if solvers[0].get_status() == opb.OPTIMAL:
+            assert solvers[0].get_num_rounds() == solvers[1].get_num_rounds()
+            assert solvers[0].get_num_byes() == solvers[1].get_num_byes()
@@ -0,0 +1,29 @@
+import optbyes as opb
+from optbyes.utils import converter, generator
+
+
+def test_same_status_with_and_without_template() -> None:
+    cache = opb.ILPTemplateCache()
+    for tp in generator.generate_team_priorities(4, 2):
+        tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+        for num_rounds in [4, 5]:
+            prob1 = opb.BaseILP(4, num_rounds, tp_array)
+            prob2 = opb.BaseILP(4, num_rounds, tp_array, cache)
+            prob1.solve()
+            prob2.solve()
+            assert prob1.get_status() == prob2.get_status()
+            assert prob1.get_model_size() == prob2.get_model_size()
+            if prob1.get_status() == opb.OPTIMAL:
+                schedule = prob2.get_schedule()
+                assert all(len(set(schedule[t].values()) - {opb.BYES}) == 3 for t in schedule)
+    assert len(cache) == 2
+
+
+def test_lru_eviction() -> None:
+    cache = opb.ILPTemplateCache(maxsize=2)
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (2, 1, 4), 4: (2, 3, 1)}
+    tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+    for num_rounds in [3, 4, 3, 5]:
+        opb.BaseILP(4, num_rounds, tp_array, cache).solve()
+    assert len(cache) == 2
+    assert list(cache._templates) == [("BaseILP", 4, 3), ("BaseILP", 4, 5)]
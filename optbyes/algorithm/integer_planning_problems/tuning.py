@@ -0,0 +1,286 @@
+"""
+Tuning of the Gurobi parameters of the ILP factories
+
+tune_params() searches the parameter sets (on a grid or at random) which minimize the solve time
+of IterateNumRoundsAlgorithm over a generated corpus of team priorities, and save_tuned_params()
+stores the best set per (factory, range of num_teams) in a JSON file.
+The factories load the tuned parameters from the file given to them
+(e.g., opb.BaseILPFactory(tuned_params=path)), or else from the path in the environment variable
+OPTBYES_TUNED_PARAMS if it is set, so that a deployment can opt in (see resolve_params()).
+Nothing is read implicitly from the home directory.
+
+The default file of the tuning is the path in OPTBYES_TUNED_PARAMS, or ~/.optbyes/tuned_params.json.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import itertools
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, TypedDict
+
+import numpy as np
+
+import optbyes as opb
+from optbyes.utils import generator
+from optbyes.utils.priority_array import PriorityArray
+
+__all__ = [
+    "TUNED_PARAMS_ENV",
+    "DEFAULT_SEARCH_SPACE",
+    "TuningResult",
+    "get_tuned_params_path",
+    "load_tuned_params",
+    "resolve_params",
+    "save_tuned_params",
+    "tune_params",
+]
+
+TUNED_PARAMS_ENV = "OPTBYES_TUNED_PARAMS"
+_VERSION = 1
+
+DEFAULT_SEARCH_SPACE: dict[str, list[int | float]] = {
+    "MIPFocus": [0, 1, 2, 3],
+    "Presolve": [-1, 0, 1, 2],
+    "Heuristics": [0.0, 0.05, 0.2],
+    "Symmetry": [-1, 0, 2],
+    "Cuts": [-1, 0, 2],
+}
+
+# The parameters set only while measuring, which are not saved
+_MEASUREMENT_PARAMS: opb.GurobiParams = {"OutputFlag": 0}
+
+# path -> (modification time, entries)
+_cache: dict[Path, tuple[float, list[TuningResult]]] = {}
+
+
+class TuningResult(TypedDict):
+    factory: str
+    min_teams: int
+    max_teams: int
+    params: opb.GurobiParams
+    median: float
+    p95: float
+    num_instances: int
+
+
+def get_tuned_params_path() -> Path:
+    """Return the path of the tuned parameter file"""
+    path = os.environ.get(TUNED_PARAMS_ENV)
+    if path:
+        return Path(path)
+    return Path.home() / ".optbyes" / "tuned_params.json"
+
+
+def _load_entries(path: Path) -> list[TuningResult]:
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return []
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != _VERSION:
+        raise ValueError(f"{path} is not a tuned parameter file of version {_VERSION}.")
+    entries: list[TuningResult] = data["entries"]
+    _cache[path] = (mtime, entries)
+    return entries
+
+
+def load_tuned_params(factory: str, num_teams: int, path: str | Path | None = None) -> opb.GurobiParams:
+    """Return the tuned parameters of the factory for num_teams ({} if not tuned)
+
+    Parameters
+    -----
+    factory: str
+        The class name of the factory, e.g., "BaseILPFactory"
+    num_teams: int
+        The number of teams
+    path: str | Path | None, optional (default = None)
+        The tuned parameter file (get_tuned_params_path() if None)
+
+    Returns
+    -----
+    params: opb.GurobiParams
+        The parameters of the entry whose range contains num_teams (the narrowest one if several)
+    """
+    entries = _load_entries(Path(path) if path is not None else get_tuned_params_path())
+    matches = [e for e in entries if e["factory"] == factory and e["min_teams"] <= num_teams <= e["max_teams"]]
+    if not matches:
+        return {}
+    best = min(matches, key=lambda e: e["max_teams"] - e["min_teams"])
+    return dict(best["params"])
+
+
+def resolve_params(
+    factory: str,
+    num_teams: int,
+    params: opb.GurobiParams | None = None,
+    tuned_params: str | Path | None = None,
+) -> opb.GurobiParams:
+    """Return the Gurobi parameters of a problem created by the factory
+
+    Parameters
+    -----
+    factory: str
+        The class name of the factory, e.g., "BaseILPFactory"
+    num_teams: int
+        The number of teams
+    params: opb.GurobiParams | None, optional (default = None)
+        The explicit parameters, which take precedence over the tuned ones
+    tuned_params: str | Path | None, optional (default = None)
+        The tuned parameter file. If None, the path in OPTBYES_TUNED_PARAMS if it is set
+        (nothing is loaded if not).
+
+    Returns
+    -----
+    params: opb.GurobiParams
+        The tuned parameters updated with params
+    """
+    if tuned_params is None:
+        tuned_params = os.environ.get(TUNED_PARAMS_ENV) or None
+    resolved = {} if tuned_params is None else load_tuned_params(factory, num_teams, tuned_params)
+    if params is not None:
+        resolved.update(params)
+    return resolved
+
+
+def save_tuned_params(result: TuningResult, path: str | Path | None = None) -> None:
+    """Save the result, replacing the entry of the same (factory, min_teams, max_teams)"""
+    path = Path(path) if path is not None else get_tuned_params_path()
+    key = (result["factory"], result["min_teams"], result["max_teams"])
+    entries = [e for e in _load_entries(path) if (e["factory"], e["min_teams"], e["max_teams"]) != key]
+    entries.append(result)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file and rename it, so that the factories never read a broken file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": _VERSION, "entries": entries}, f, indent=2)
+    os.replace(tmp_path, path)
+    _cache.pop(path, None)
+
+
+def _generate_candidates(
+    search_space: dict[str, list[int | float]], method: str, num_candidates: int, rng: np.random.Generator
+) -> list[opb.GurobiParams]:
+    """The default parameters first, then the grid (in order) or random points of the search space"""
+    names = list(search_space)
+    if method == "grid":
+        points = [dict(zip(names, values)) for values in itertools.product(*search_space.values())]
+    elif method == "random":
+        points = [
+            {name: search_space[name][rng.integers(len(search_space[name]))] for name in names}
+            for _ in range(num_candidates)
+        ]
+    else:
+        raise ValueError('method must be "grid" or "random".')
+    candidates: list[opb.GurobiParams] = [{}]
+    for params in points:
+        if params not in candidates:
+            candidates.append(params)
+    return candidates
+
+
+def _generate_corpus(num_teams_range: tuple[int, int], num_instances: int, seed: int) -> list[PriorityArray]:
+    """num_instances priorities per num_teams, feasible and perturbed by a few swaps"""
+    rng = np.random.default_rng(seed)
+    corpus = []
+    for num_teams in range(num_teams_range[0], num_teams_range[1] + 1):
+        for k in range(num_instances):
+            array = generator.generate_near_feasible_priority_array(num_teams, k % 3, rng)
+            corpus.append(PriorityArray(array))
+    return corpus
+
+
+def _measure(factory: opb.ILPFactory, corpus: list[PriorityArray]) -> list[float]:
+    times = []
+    for priority in corpus:
+        solver = opb.IterateNumRoundsAlgorithm.create_from_team_priority(priority, factory)
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            solver.solve()
+        times.append(time.perf_counter() - start_time)
+    return times
+
+
+def tune_params(
+    factory_class: Callable[..., opb.ILPFactory],
+    num_teams_range: tuple[int, int],
+    search_space: dict[str, list[int | float]] | None = None,
+    method: str = "random",
+    num_candidates: int = 20,
+    num_instances: int = 10,
+    seed: int = 0,
+    path: str | Path | None = None,
+    save: bool = True,
+) -> TuningResult:
+    """Search the Gurobi parameters minimizing the solve time of the factory
+
+    Every candidate parameter set (and the default parameters) solves the same corpus of
+    num_instances priorities per num_teams in num_teams_range with IterateNumRoundsAlgorithm.
+    The candidate with the smallest median solve time wins (the 95th percentile breaks ties).
+
+    Parameters
+    -----
+    factory_class: Callable[..., opb.ILPFactory]
+        The factory class taking the keyword argument params, e.g., opb.BaseILPFactory
+    num_teams_range: tuple[int, int]
+        The minimum and maximum number of teams (inclusive)
+    search_space: dict[str, list[int | float]] | None, optional (default = None)
+        The values of each parameter (DEFAULT_SEARCH_SPACE if None)
+    method: str, optional (default = "random")
+        "grid" (every combination) or "random" (num_candidates random combinations)
+    num_candidates: int, optional (default = 20)
+        The number of random candidates
+    num_instances: int, optional (default = 10)
+        The number of priorities per number of teams
+    seed: int, optional (default = 0)
+        The random seed of the corpus and the candidates
+    path: str | Path | None, optional (default = None)
+        The tuned parameter file (get_tuned_params_path() if None)
+    save: bool, optional (default = True)
+        Whether to save the best parameters to the file
+
+    Returns
+    -----
+    result: TuningResult
+        The best parameters with their median and 95th percentile solve time (seconds)
+    """
+    min_teams, max_teams = num_teams_range
+    if not 2 <= min_teams <= max_teams:
+        raise ValueError("num_teams_range must be (min_teams, max_teams) with 2 <= min_teams <= max_teams.")
+    rng = np.random.default_rng(seed)
+    corpus = _generate_corpus(num_teams_range, num_instances, seed)
+    candidates = _generate_candidates(search_space or DEFAULT_SEARCH_SPACE, method, num_candidates, rng)
+
+    # Warm up (the Gurobi environment and the model templates), which would otherwise slow the first candidate.
+    _measure(factory_class(params=_MEASUREMENT_PARAMS), corpus)
+
+    best: tuple[float, float, opb.GurobiParams] | None = None
+    for params in candidates:
+        factory = factory_class(params={**params, **_MEASUREMENT_PARAMS})
+        times = _measure(factory, corpus)
+        median, p95 = float(np.median(times)), float(np.percentile(times, 95))
+        if best is None or (median, p95) < best[:2]:
+            best = (median, p95, params)
+    assert best is not None
+
+    factory_name = getattr(factory_class, "__name__", type(factory_class).__name__)
+    result: TuningResult = {
+        "factory": factory_name,
+        "min_teams": min_teams,
+        "max_teams": max_teams,
+        "params": best[2],
+        "median": best[0],
+        "p95": best[1],
+        "num_instances": len(corpus),
+    }
+    if save:
+        save_tuned_params(result, path)
+    return result
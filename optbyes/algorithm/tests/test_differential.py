@@ -0,0 +1,85 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from scipy import special
+
+import optbyes as opb
+from optbyes.utils import converter, generator, precedence, validator
+
+NUM_RANDOM_INSTANCES = 200
+
+
+def _solve_with_all_algorithms(tp: opb.TeamPriority) -> list[tuple[str, opb.Status, int, list[str]]]:
+    """Return (algorithm name, status, num_rounds, violations) of each algorithm"""
+    solvers: dict[str, opb.OptByesAlgorithm] = {
+        "graph": opb.TopologicalSortAlgorithm.create_from_team_priority(tp),
+        "gurobi": opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, opb.BaseILPFactory()),
+    }
+    results = []
+    for name, solver in solvers.items():
+        solver.solve()
+        num_rounds, violations = 0, []
+        if solver.get_status() == opb.OPTIMAL:
+            num_rounds = solver.get_num_rounds()
+            violations = [v.message for v in validator.validate_schedule(tp, solver.get_schedule())]
+        results.append((name, solver.get_status(), num_rounds, violations))
+    results.append(_solve_with_ilp_without_presolve(tp))
+    return results
+
+
+def _solve_with_ilp_without_presolve(tp: opb.TeamPriority) -> tuple[str, opb.Status, int, list[str]]:
+    """Let Gurobi decide the feasibility, which the algorithms decide by the critical path analytics
+
+    BaseILP without the presolve must be infeasible with lower bound - 1 rounds
+    and optimal with the lower bound, and infeasible with n(n - 1) / 2 rounds (the maximum)
+    if the priority has a cycle.
+    """
+    num_teams = len(tp)
+    tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+    analysis = precedence.CriticalPathAnalysis.create_from_team_priority(tp)
+    violations = []
+    if analysis.is_acyclic():
+        num_rounds = max(num_teams - 1, analysis.get_lower_bound())
+        below = opb.BaseILP(num_teams, num_rounds - 1, tp_array, presolve=False)
+        below.solve()
+        if below.get_status() != opb.INFEASIBLE:
+            violations.append(f"feasible with {num_rounds - 1} rounds")
+    else:
+        num_rounds = int(special.comb(num_teams, 2, exact=True))
+    prob = opb.BaseILP(num_teams, num_rounds, tp_array, presolve=False)
+    prob.solve()
+    if prob.get_status() != opb.OPTIMAL:
+        return "ilp", prob.get_status(), 0, violations
+    violations += [v.message for v in validator.validate_schedule(tp, prob.get_schedule())]
+    return "ilp", prob.get_status(), num_rounds, violations
+
+
+def _random_team_priority(num_teams: int, rng: random.Random) -> opb.TeamPriority:
+    return {
+        t: tuple(rng.sample([i for i in range(1, num_teams + 1) if i != t], num_teams - 1))
+        for t in range(1, num_teams + 1)
+    }
+
+
+def _run_differential_test(team_priorities: list[opb.TeamPriority]) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=ctx) as executor:
+        for tp, results in zip(
+            team_priorities, executor.map(_solve_with_all_algorithms, team_priorities, chunksize=16)
+        ):
+            _, status, num_rounds, _ = results[0]
+            for name, other_status, other_num_rounds, violations in results:
+                assert violations == [], f"{name}: {tp}"
+                assert other_status == status, f"{name}: {tp}"
+                assert other_num_rounds == num_rounds, f"{name}: {tp}"
+
+
+def test_differential_teams4_all_combinations() -> None:
+    _run_differential_test(generator.generate_team_priorities(4, 1))
+
+
+def test_differential_random_instances() -> None:
+    rng = random.Random(0)
+    _run_differential_test([_random_team_priority(rng.choice([3, 4]), rng) for _ in range(NUM_RANDOM_INSTANCES)])
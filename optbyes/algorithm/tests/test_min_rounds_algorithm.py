@@ -0,0 +1,32 @@
+import pytest
+
+import optbyes as opb
+from optbyes.utils import generator
+
+
+def test_infeasible_instance() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 4, 2), 4: (1, 2, 3)}
+    solver = opb.MinRoundsAlgorithm.create_from_team_priority(tp)
+    solver.solve()
+    with pytest.raises(opb.InfeasibleInstanceError):
+        solver.get_schedule()
+
+
+def test_num_rounds_teams4_round5() -> None:
+    tp: opb.TeamPriority = {1: (2, 4, 3), 2: (1, 3, 4), 3: (4, 1, 2), 4: (3, 1, 2)}
+    solver = opb.MinRoundsAlgorithm.create_from_team_priority(tp)
+    solver.solve()
+    assert solver.get_status() == opb.OPTIMAL
+    assert solver.get_num_rounds() == 5
+    assert sum(solver.get_num_byes().values()) == 8
+
+
+def test_same_num_rounds_as_graph_algorithm() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        solver_1 = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver_2 = opb.MinRoundsAlgorithm.create_from_team_priority(tp)
+        solver_1.solve()
+        solver_2.solve()
+        assert solver_1.get_status() == solver_2.get_status()
+        if solver_1.get_status() == opb.OPTIMAL:
+            assert solver_1.get_num_rounds() == solver_2.get_num_rounds()
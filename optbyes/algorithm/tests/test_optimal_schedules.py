@@ -0,0 +1,82 @@
+import itertools
+
+import pytest
+
+import optbyes as opb
+from optbyes.utils import converter, generator, precedence, validator
+
+
+def _count_by_brute_force(tp: opb.TeamPriority) -> int:
+    analysis = precedence.CriticalPathAnalysis.create_from_team_priority(tp)
+    G = converter.convert_team_priority_to_graph(tp)
+    index = {node: u for u, node in enumerate(analysis.get_matches())}
+    windows = [range(e, l + 1) for e, l in zip(analysis.get_earliest_rounds(), analysis.get_latest_rounds())]
+    return sum(all(rounds[index[u]] < rounds[index[v]] for u, v in G.edges) for rounds in itertools.product(*windows))
+
+
+def test_all_optimal_schedules() -> None:
+    for tp in itertools.islice(generator.generate_team_priorities(4, 2), 0, None, 7):
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        if not solver.get_critical_path_analysis().is_acyclic():
+            with pytest.raises(opb.InfeasibleInstanceError):
+                next(solver.iter_optimal_schedules())
+            continue
+        schedules = list(solver.iter_optimal_schedules())
+        solver.solve()
+        assert schedules[0] == solver.get_schedule()
+        assert len(schedules) == _count_by_brute_force(tp)
+        assert len({str(schedule) for schedule in schedules}) == len(schedules)
+        for schedule in schedules:
+            assert validator.validate_schedule(tp, schedule) == []
+            assert len(schedule[1]) == solver.get_num_rounds()
+
+
+def test_optimal_schedules_limit_and_seed() -> None:
+    priority_array = generator.generate_near_feasible_priority_array(6, 2, seed=5)
+    tp = converter.convert_priority_array_to_team_priority(priority_array)
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+    all_schedules = {str(schedule) for schedule in solver.iter_optimal_schedules()}
+    assert len(all_schedules) == _count_by_brute_force(tp) == 75
+    shuffled = [str(schedule) for schedule in solver.iter_optimal_schedules(seed=1)]
+    assert set(shuffled) == all_schedules
+    assert [str(schedule) for schedule in solver.iter_optimal_schedules(limit=3, seed=1)] == shuffled[:3]
+    assert len(list(solver.iter_optimal_schedules(limit=0))) == 0
+
+
+def test_iter_rounds_same_as_solve() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        rounds = []
+        try:
+            for matches in solver.iter_rounds():
+                rounds.append(matches)
+        except opb.InfeasibleInstanceError:
+            rounds = []
+        solver.solve()
+        if solver.get_status() != opb.OPTIMAL:
+            assert rounds == []
+            continue
+        schedule = solver.get_schedule()
+        assert len(rounds) == solver.get_num_rounds()
+        for r, matches in enumerate(rounds, 1):
+            assert matches == sorted((i, j) for i, j in ((i, schedule[i][r]) for i in tp) if i < j)
+
+        G = converter.convert_team_priority_to_graph(tp)
+        assert converter.convert_graph_to_team_priority(4, G) == tp
+        assert list(opb.TopologicalSortAlgorithm.create_from_graph(4, G).iter_rounds()) == rounds
+
+
+def test_iter_rounds_after_solve_from_graph() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    G = converter.convert_team_priority_to_graph(tp)
+    solver = opb.TopologicalSortAlgorithm.create_from_graph(4, G)
+    solver.solve()
+    schedule = solver.get_schedule()
+    rounds = list(solver.iter_rounds())
+    assert len(rounds) == solver.get_num_rounds()
+    for r, matches in enumerate(rounds, 1):
+        assert matches == sorted((i, j) for i, j in ((i, schedule[i][r]) for i in tp) if i < j)
+
+    # solve() can be called again with the same result
+    solver.solve()
+    assert solver.get_schedule() == schedule
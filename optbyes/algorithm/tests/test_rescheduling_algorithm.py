@@ -0,0 +1,106 @@
+import random
+
+import networkx as nx
+import pytest
+
+import optbyes as opb
+from optbyes.utils import converter, generator, validator
+
+
+def _expected_rounds(tp: opb.TeamPriority, schedule: opb.Schedule, num_played: int) -> dict[opb.OpbNode, int]:
+    """Re-layer every unplayed match from scratch"""
+    G = converter.convert_team_priority_to_graph(tp)
+    round_of: dict[opb.OpbNode, int] = {}
+    for node in nx.topological_sort(G):
+        i, j = node
+        played_round = next(r for r, t in schedule[i].items() if t == j)
+        if played_round <= num_played:
+            round_of[node] = played_round
+        else:
+            round_of[node] = 1 + max([num_played] + [round_of[pred] for pred in G.predecessors(node)])
+    return round_of
+
+
+def test_reschedule_random_instances() -> None:
+    rng = random.Random(0)
+    for seed in range(100):
+        num_teams = rng.randint(3, 10)
+        tp = converter.convert_priority_array_to_team_priority(
+            generator.generate_feasible_priority_array(num_teams, seed=seed)
+        )
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver.solve()
+        schedule = solver.get_schedule()
+
+        num_played = rng.randint(0, solver.get_num_rounds() - 1)
+        team = rng.randint(1, num_teams)
+        num_team_played = sum(1 for r, j in schedule[team].items() if r <= num_played and j != opb.BYES)
+        remaining = list(tp[team][num_team_played:])
+        rng.shuffle(remaining)
+        new_tp = dict(tp)
+        new_tp[team] = tp[team][:num_team_played] + tuple(remaining)
+
+        rescheduler = opb.ReschedulingAlgorithm.create_from_schedule(tp, schedule)
+        rescheduler.update_team_priority(team, new_tp[team], num_played)
+        rescheduler.solve()
+
+        checker = opb.TopologicalSortAlgorithm.create_from_team_priority(new_tp)
+        checker.solve()
+        assert rescheduler.get_status() == checker.get_status()
+        if rescheduler.get_status() == opb.INFEASIBLE:
+            cycle = rescheduler.get_cycle()
+            G = converter.convert_team_priority_to_graph(new_tp)
+            assert all(G.has_edge(u, v) for u, v in zip(cycle, cycle[1:] + cycle[:1]))
+            continue
+        new_schedule = rescheduler.get_schedule()
+        assert validator.validate_schedule(new_tp, new_schedule) == []
+        for r in range(1, num_played + 1):
+            assert all(new_schedule[t][r] == schedule[t][r] for t in tp)
+        expected = _expected_rounds(new_tp, schedule, num_played)
+        assert rescheduler.get_num_rounds() == max(expected.values())
+        assert all(new_schedule[i][r] == j for (i, j), r in expected.items())
+
+
+def test_reorder_played_team() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 4, 3), 3: (4, 1, 2), 4: (3, 2, 1)}
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+    solver.solve()
+    rescheduler = opb.ReschedulingAlgorithm.create_from_schedule(tp, solver.get_schedule())
+    rescheduler.update_team_priority(1, (3, 2, 4), num_played=1)
+    with pytest.raises(ValueError):
+        rescheduler.solve()
+
+
+def test_rejected_batch_is_rolled_back() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+    solver.solve()
+    schedule = solver.get_schedule()
+
+    rescheduler = opb.ReschedulingAlgorithm.create_from_schedule(tp, schedule)
+    rescheduler.update_team_priority(1, (2, 4, 3), num_played=1)  # feasible alone
+    rescheduler.update_team_priority(3, (1, 4, 2), num_played=1)  # creates a cycle
+    rescheduler.solve()
+    assert rescheduler.get_status() == opb.INFEASIBLE
+    assert rescheduler.get_cycle() != []
+    assert rescheduler.get_critical_path_analysis().get_lower_bound() == solver.get_num_rounds()
+
+    # Neither change was kept.
+    rescheduler.solve()
+    assert rescheduler.get_status() == opb.OPTIMAL
+    assert rescheduler.get_schedule() == schedule
+
+
+def test_rejected_batch_by_value_error_is_rolled_back() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+    solver.solve()
+    schedule = solver.get_schedule()
+
+    rescheduler = opb.ReschedulingAlgorithm.create_from_schedule(tp, schedule)
+    rescheduler.update_team_priority(1, (2, 4, 3), num_played=1)
+    rescheduler.update_team_priority(2, (3, 1, 4), num_played=1)  # team 2 already played team 1
+    with pytest.raises(ValueError):
+        rescheduler.solve()
+    rescheduler.solve()
+    assert rescheduler.get_schedule() == schedule
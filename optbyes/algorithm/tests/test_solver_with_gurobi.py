@@ -1,6 +1,7 @@
 import pytest
 
 import optbyes as opb
+from optbyes.utils import converter, precedence
 
 
 def test_not_runnnning_solve_method() -> None:
@@ -22,6 +23,15 @@ def test_infeasible_instance() -> None:
     assert str(e.value) == ""
 
 
+def test_infeasible_instance_without_presolve() -> None:
+    # Gurobi proves the infeasibility, which the presolve decides by the cycle of the precedence graph.
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 4, 2), 4: (1, 2, 3)}
+    tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+    prob = opb.BaseILP(4, 6, tp_array, presolve=False)
+    prob.solve()
+    assert prob.get_status() == opb.INFEASIBLE
+
+
 def test_num_byes_teams4_byes8() -> None:
     tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (2, 1, 4), 4: (2, 3, 1)}
     factory = opb.BaseILPFactory()
@@ -75,3 +85,65 @@ def test_num_rounds_teams4_round4() -> None:
         prob.solve()
         assert prob.get_status() == opb.OPTIMAL
         assert prob.get_num_rounds() == 4
+
+
+def test_parallel_same_as_sequential() -> None:
+    team_priorities: list[opb.TeamPriority] = [
+        {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 4, 2), 4: (1, 2, 3)},  # infeasible
+        {1: (2, 3, 4), 2: (1, 4, 3), 3: (4, 1, 2), 4: (3, 2, 1)},  # round 3
+        {1: (2, 3, 4), 2: (1, 3, 4), 3: (4, 1, 2), 4: (3, 1, 2)},  # round 4
+        {1: (2, 4, 3), 2: (1, 3, 4), 3: (4, 1, 2), 4: (3, 1, 2)},  # round 5
+        {1: (2, 3, 4), 2: (1, 4, 3), 3: (2, 1, 4), 4: (2, 3, 1)},  # round 6
+    ]
+    for tp in team_priorities:
+        factory = opb.BaseILPFactory()
+        solver_1 = opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, factory)
+        solver_2 = opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, factory, num_workers=3)
+        solver_1.solve()
+        solver_2.solve()
+        assert solver_1.get_status() == solver_2.get_status()
+        if solver_1.get_status() == opb.OPTIMAL:
+            assert solver_1.get_num_rounds() == solver_2.get_num_rounds()
+            assert solver_1.get_num_byes() == solver_2.get_num_byes()
+
+
+class _FirstRoundsUnavailableFactory(opb.ILPFactory):
+    """Every team is unavailable in the first 2 rounds, so the lower bound is infeasible
+
+    Defined at the module level, so that it can be pickled for the spawned workers.
+    """
+
+    def create(
+        self,
+        num_teams: int,
+        num_rounds: int,
+        tp_array: opb.TeamPriorityArray,
+        analysis: precedence.CriticalPathAnalysis | None = None,
+    ) -> opb.ILP:
+        unavailable_rounds = {t: {1, 2} for t in range(1, num_teams + 1)}
+        return opb.UnavailableRoundsILP(num_teams, num_rounds, tp_array, unavailable_rounds, presolve=False)
+
+
+def test_parallel_solve_after_infeasible_lower_bound() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 4, 3), 3: (4, 1, 2), 4: (3, 2, 1)}  # round 3
+    factory = _FirstRoundsUnavailableFactory()
+    solver_1 = opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, factory)
+    solver_2 = opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, factory, num_workers=3)
+    solver_1.solve()
+    solver_2.solve()
+    assert solver_1.get_num_rounds() == solver_2.get_num_rounds() == 5
+
+
+def test_factory_without_analysis_argument() -> None:
+    class _LegacyFactory(opb.ILPFactory):
+        def create(  # type: ignore[override]
+            self, num_teams: int, num_rounds: int, tp_array: opb.TeamPriorityArray
+        ) -> opb.ILP:
+            return opb.BaseILP(num_teams, num_rounds, tp_array)
+
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 4, 3), 3: (4, 1, 2), 4: (3, 2, 1)}
+    solver_1 = opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, _LegacyFactory())
+    solver_2 = opb.IterateNumRoundsAlgorithm.create_from_team_priority(tp, opb.BaseILPFactory())
+    solver_1.solve()
+    solver_2.solve()
+    assert solver_1.get_num_rounds() == solver_2.get_num_rounds()
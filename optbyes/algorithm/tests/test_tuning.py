@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import optbyes as opb
+from optbyes.utils import converter
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tuned_params(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Never read or write the tuned parameter file of the developer.
+    monkeypatch.delenv(opb.TUNED_PARAMS_ENV, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+
+def test_tune_and_load_params(tmp_path: Path) -> None:
+    path = tmp_path / "tuned_params.json"
+    search_space: dict[str, list[int | float]] = {"MIPFocus": [1, 2]}
+    result = opb.tune_params(opb.BaseILPFactory, (4, 4), search_space, method="grid", num_instances=2, path=path)
+    assert result["params"] in [{}, {"MIPFocus": 1}, {"MIPFocus": 2}]
+    assert 0 < result["median"] <= result["p95"]
+    assert result["num_instances"] == 2
+
+    # Overwrite the entry with known parameters.
+    opb.save_tuned_params({**result, "params": {"MIPFocus": 2}}, path)
+    opb.save_tuned_params({**result, "factory": "RoundIndexILPFactory", "params": {"Presolve": 0}}, path)
+    with open(path) as f:
+        assert len(json.load(f)["entries"]) == 2
+    assert opb.load_tuned_params("BaseILPFactory", 4, path) == {"MIPFocus": 2}
+    assert opb.load_tuned_params("BaseILPFactory", 5, path) == {}
+
+
+def test_factories_load_tuned_params_only_if_given(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "tuned_params.json"
+    entry: opb.TuningResult = {
+        "factory": "BaseILPFactory",
+        "min_teams": 4,
+        "max_teams": 4,
+        "params": {"MIPFocus": 2},
+        "median": 0.0,
+        "p95": 0.0,
+        "num_instances": 0,
+    }
+    opb.save_tuned_params(entry, path)
+    opb.save_tuned_params({**entry, "factory": "RoundIndexILPFactory", "params": {"Presolve": 0}}, path)
+    # The file in the home directory is never read implicitly.
+    opb.save_tuned_params(entry, opb.get_tuned_params_path())
+
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+    prob = opb.BaseILPFactory().create(4, 5, tp_array)
+    prob.solve()
+    assert prob._model.Params.MIPFocus == 0
+
+    prob = opb.BaseILPFactory(tuned_params=path).create(4, 5, tp_array)
+    prob.solve()
+    assert prob.get_status() == opb.OPTIMAL
+    assert prob._model.Params.MIPFocus == 2
+    # Explicit parameters take precedence over the tuned ones.
+    prob = opb.BaseILPFactory(params={"MIPFocus": 1}, tuned_params=path).create(4, 5, tp_array)
+    prob.solve()
+    assert prob._model.Params.MIPFocus == 1
+
+    # A deployment opts in with the environment variable.
+    monkeypatch.setenv(opb.TUNED_PARAMS_ENV, str(path))
+    prob = opb.BaseILPFactory().create(4, 5, tp_array)
+    prob.solve()
+    assert prob._model.Params.MIPFocus == 2
+    round_index_prob = opb.RoundIndexILPFactory().create(4, 5, tp_array)
+    round_index_prob.solve()
+    assert round_index_prob._model.Params.Presolve == 0
+
+
+def test_min_rounds_algorithm_params(tmp_path: Path) -> None:
+    path = tmp_path / "tuned_params.json"
+    entry: opb.TuningResult = {
+        "factory": "BaseILPFactory",
+        "min_teams": 4,
+        "max_teams": 4,
+        "params": {"MIPFocus": 2, "OutputFlag": 0},
+        "median": 0.0,
+        "p95": 0.0,
+        "num_instances": 0,
+    }
+    opb.save_tuned_params(entry, path)
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    solver = opb.MinRoundsAlgorithm.create_from_team_priority(tp, params={"MIPFocus": 1}, tuned_params=path)
+    assert opb.resolve_params("BaseILPFactory", 4, {"MIPFocus": 1}, path) == {"MIPFocus": 1, "OutputFlag": 0}
+    solver.solve()
+    assert solver.get_num_rounds() == 5
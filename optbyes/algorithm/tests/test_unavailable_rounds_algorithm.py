@@ -0,0 +1,79 @@
+import optbyes as opb
+from optbyes.utils import converter, generator, validator
+
+
+def test_infeasible_instance() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 4, 2), 4: (1, 2, 3)}
+    solver = opb.UnavailableRoundsAlgorithm.create_from_team_priority(tp, {1: {1}})
+    solver.solve()
+    assert solver.get_status() == opb.INFEASIBLE
+
+
+def test_no_unavailable_rounds() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        solver_1 = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver_2 = opb.UnavailableRoundsAlgorithm.create_from_team_priority(tp, {})
+        solver_1.solve()
+        solver_2.solve()
+        assert solver_1.get_status() == solver_2.get_status()
+        if solver_1.get_status() == opb.OPTIMAL:
+            assert solver_1.get_schedule() == solver_2.get_schedule()
+
+
+def test_teams4_round3_unavailable() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 4, 3), 3: (4, 1, 2), 4: (3, 2, 1)}
+    unavailable_rounds: opb.UnavailableRounds = {1: {2}}
+    solver = opb.UnavailableRoundsAlgorithm.create_from_team_priority(tp, unavailable_rounds)
+    solver.solve()
+    assert solver.get_status() == opb.OPTIMAL
+    assert solver.get_num_rounds() == 4
+    schedule = solver.get_schedule()
+    assert schedule[1][2] == opb.BYES
+
+
+def test_same_num_rounds_as_ilp() -> None:
+    unavailable_rounds: opb.UnavailableRounds = {2: {1, 3}, 4: {2}}
+    for tp in generator.generate_team_priorities(4, 2):
+        solver = opb.UnavailableRoundsAlgorithm.create_from_team_priority(tp, unavailable_rounds)
+        solver.solve()
+        tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+        prob = opb.UnavailableRoundsILP(4, 8, tp_array, unavailable_rounds)
+        prob.solve()
+        assert solver.get_status() == prob.get_status()
+        if prob.get_status() == opb.OPTIMAL:
+            assert solver.get_num_rounds() == len(prob.get_schedule()[1])
+            for t, rounds in unavailable_rounds.items():
+                assert all(solver.get_schedule()[t][r] == opb.BYES for r in rounds)
+
+
+def test_fully_unavailable_middle_round() -> None:
+    # Every team is unavailable in round 2, which is left empty.
+    unavailable_rounds: opb.UnavailableRounds = {t: {2} for t in range(1, 5)}
+    for tp in generator.generate_team_priorities(4, 2):
+        solver_1 = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver_2 = opb.UnavailableRoundsAlgorithm.create_from_team_priority(tp, unavailable_rounds)
+        solver_1.solve()
+        solver_2.solve()
+        assert solver_1.get_status() == solver_2.get_status()
+        if solver_1.get_status() != opb.OPTIMAL:
+            continue
+        assert solver_2.get_num_rounds() == solver_1.get_num_rounds() + 1
+        assert all(solver_2.get_schedule()[t][2] == opb.BYES for t in range(1, 5))
+
+        tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+        prob = opb.UnavailableRoundsILP(4, 8, tp_array, unavailable_rounds, incumbent=solver_2.get_schedule())
+        prob.solve()
+        assert prob.get_status() == opb.OPTIMAL
+        assert len(prob.get_schedule()[1]) == solver_2.get_num_rounds()
+
+
+def test_teams4_round2_unavailable_for_all() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    unavailable_rounds: opb.UnavailableRounds = {t: {2} for t in range(1, 5)}
+    solver = opb.UnavailableRoundsAlgorithm.create_from_team_priority(tp, unavailable_rounds)
+    solver.solve()
+    assert solver.get_status() == opb.OPTIMAL
+    # 5 rounds without the unavailable round
+    assert solver.get_num_rounds() == 6
+    assert validator.validate_schedule(tp, solver.get_schedule()) == []
+    assert all(solver.get_schedule()[t][2] == opb.BYES for t in range(1, 5))
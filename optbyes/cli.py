@@ -0,0 +1,320 @@
+"""
+Command line interface solving profile files in bulk
+
+The profiles are read as a stream in chunks, solved (in worker processes with --workers),
+and the results are written as JSON lines in the input order, so the memory use is bounded
+by the chunks in flight regardless of the size of the files.
+
+Input formats
+-----
+jsonl
+    One profile per line, either {"id": ..., "team_priority": {"1": [2, 3, 4], ...}},
+    the team priority itself ({"1": [2, 3, 4], ...}) or the list of the rows ([[2, 3, 4], [1, 3, 4], ...]).
+csv
+    One profile per row, the num_teams x (num_teams - 1) priority array flattened row by row.
+    Empty rows and rows starting with "#" are skipped.
+bin
+    A PriorityArrayFile (see optbyes.utils.priority_array).
+
+Output
+-----
+One JSON object per profile:
+{"index": ..., "id": ..., "status": "optimal" | "infeasible", "num_rounds": ..., "num_byes": {...},
+"schedule": ...} ("id" only if the input has it, "schedule" only with --schedule).
+
+Examples
+-----
+>>> $ optbyes profiles.jsonl --algorithm graph --workers 8 --output results.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, TypedDict
+
+import numpy as np
+
+import optbyes as opb
+from optbyes.utils.priority_array import PriorityArray, PriorityArrayFile
+
+__all__ = [
+    "FORMATS",
+    "ALGORITHMS",
+    "Profile",
+    "Result",
+    "read_profiles",
+    "solve_chunk",
+    "solve_profiles",
+    "main",
+]
+
+FORMATS = ("jsonl", "csv", "bin")
+ALGORITHMS = ("graph", "gurobi")
+STATUS_NAMES = {opb.LOADED: "loaded", opb.OPTIMAL: "optimal", opb.INFEASIBLE: "infeasible"}
+
+# (index in the input, id given in the input (or None), priority)
+Profile = tuple[int, Any, PriorityArray]
+
+
+class Result(TypedDict, total=False):
+    index: int
+    id: Any
+    status: str
+    num_rounds: int | None
+    num_byes: dict[int, int] | None
+    schedule: opb.Schedule
+
+
+def _parse_json_profile(obj: Any) -> tuple[Any, PriorityArray]:
+    profile_id = None
+    if isinstance(obj, dict) and "team_priority" in obj:
+        profile_id = obj.get("id")
+        obj = obj["team_priority"]
+    if isinstance(obj, dict):
+        team_priority = {int(t): tuple(opposing_teams) for t, opposing_teams in obj.items()}
+        return profile_id, PriorityArray.from_team_priority(team_priority)
+    return profile_id, PriorityArray(np.array(obj))
+
+
+def _read_jsonl(f: IO[str]) -> Iterator[tuple[Any, PriorityArray]]:
+    for line in f:
+        if line.strip():
+            yield _parse_json_profile(json.loads(line))
+
+
+def _read_csv(f: IO[str]) -> Iterator[tuple[Any, PriorityArray]]:
+    for row in csv.reader(f):
+        if not row or row[0].lstrip().startswith("#"):
+            continue
+        values = np.array([int(v) for v in row])
+        num_teams = (1 + math.isqrt(1 + 4 * len(values))) // 2  # num_teams * (num_teams - 1) = len(values)
+        if num_teams * (num_teams - 1) != len(values):
+            raise ValueError(f"A row of {len(values)} values is not a num_teams x (num_teams - 1) array.")
+        yield None, PriorityArray(values.reshape(num_teams, num_teams - 1))
+
+
+def read_profiles(path: str | Path, fmt: str | None = None) -> Iterator[Profile]:
+    """Read the profiles lazily from the file ("-" for the standard input)
+
+    Parameters
+    -----
+    path: str | Path
+        The input file
+    fmt: str | None, optional (default = None)
+        "jsonl", "csv" or "bin" (decided from the extension if None)
+
+    Yields
+    -----
+    profile: Profile
+        (index in the input, id given in the input (or None), priority)
+    """
+    if fmt is None:
+        suffix = Path(path).suffix.lstrip(".").lower()
+        fmt = {"json": "jsonl", "ndjson": "jsonl"}.get(suffix, suffix)
+    if fmt not in FORMATS:
+        raise ValueError(f"The format must be one of {FORMATS}.")
+
+    if fmt == "bin":
+        with PriorityArrayFile.open(path) as f:
+            for index, priority in enumerate(f):
+                yield index, None, priority
+        return
+
+    with contextlib.ExitStack() as stack:
+        if str(path) == "-":
+            text: IO[str] = sys.stdin
+        else:
+            text = stack.enter_context(open(path, newline="" if fmt == "csv" else None))
+        records = _read_jsonl(text) if fmt == "jsonl" else _read_csv(text)
+        for index, (profile_id, priority) in enumerate(records):
+            yield index, profile_id, priority
+
+
+def _solve(priority: PriorityArray, algorithm: str, tuned_params: str | None = None) -> opb.OptByesAlgorithm:
+    solver: opb.OptByesAlgorithm
+    if algorithm == "graph":
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(priority)
+    elif algorithm == "gurobi":
+        # The Gurobi log is turned off per model, leaving the global defaults of the caller untouched.
+        factory = opb.BaseILPFactory(params={"OutputFlag": 0}, tuned_params=tuned_params)
+        solver = opb.IterateNumRoundsAlgorithm.create_from_team_priority(priority, factory)
+    else:
+        raise ValueError(f"algorithm must be one of {ALGORITHMS}.")
+    solver.solve()
+    return solver
+
+
+def solve_chunk(
+    profiles: list[Profile], algorithm: str, with_schedule: bool = False, tuned_params: str | None = None
+) -> list[Result]:
+    """Solve the profiles and return their results in the same order"""
+    results: list[Result] = []
+    # The algorithms report their progress with print(), which must not mix with the results on stdout.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for index, profile_id, priority in profiles:
+            solver = _solve(priority, algorithm, tuned_params)
+            result: Result = {"index": index}
+            if profile_id is not None:
+                result["id"] = profile_id
+            result["status"] = STATUS_NAMES[solver.get_status()]
+            if solver.get_status() == opb.OPTIMAL:
+                result["num_rounds"] = solver.get_num_rounds()
+                result["num_byes"] = solver.get_num_byes()
+                if with_schedule:
+                    result["schedule"] = solver.get_schedule()
+            else:
+                result["num_rounds"] = None
+                result["num_byes"] = None
+            results.append(result)
+    return results
+
+
+def _chunked(profiles: Iterable[Profile], chunk_size: int) -> Iterator[list[Profile]]:
+    iterator = iter(profiles)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def solve_profiles(
+    profiles: Iterable[Profile],
+    algorithm: str = "graph",
+    workers: int = 1,
+    chunk_size: int = 256,
+    with_schedule: bool = False,
+    tuned_params: str | None = None,
+) -> Iterator[Result]:
+    """Solve the profiles lazily and yield the results in the input order
+
+    Parameters
+    -----
+    profiles: Iterable[Profile]
+        The profiles, e.g., read_profiles()
+    algorithm: str, optional (default = "graph")
+        "graph" (TopologicalSortAlgorithm) or "gurobi" (IterateNumRoundsAlgorithm)
+    workers: int, optional (default = 1)
+        The number of worker processes. If 1, the profiles are solved in this process.
+        The workers are started with the "spawn" method, since Gurobi is not safe to fork.
+    chunk_size: int, optional (default = 256)
+        The number of profiles sent to a worker at once.
+        At most 2 * workers chunks are in flight, which bounds the memory use.
+    with_schedule: bool, optional (default = False)
+        Whether to include the schedules in the results
+    tuned_params: str | None, optional (default = None)
+        The tuned parameter file the "gurobi" algorithm loads the Gurobi parameters from
+        (the one in OPTBYES_TUNED_PARAMS if None, see opb.resolve_params())
+
+    Yields
+    -----
+    result: Result
+        The result of each profile
+    """
+    if workers < 1:
+        raise ValueError("workers must be positive.")
+    chunks = _chunked(profiles, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from solve_chunk(chunk, algorithm, with_schedule, tuned_params)
+        return
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        futures: deque[Future[list[Result]]] = deque()
+        for chunk in chunks:
+            futures.append(executor.submit(solve_chunk, chunk, algorithm, with_schedule, tuned_params))
+            if len(futures) >= 2 * workers:
+                yield from futures.popleft().result()
+        while futures:
+            yield from futures.popleft().result()
+
+
+class _ProgressReporter:
+    """Report the number of solved profiles and the throughput to stderr at most every interval seconds"""
+
+    def __init__(self, interval: float, stream: IO[str] | None = None) -> None:
+        self._interval = interval
+        self._stream = sys.stderr if stream is None else stream
+        self._start_time = time.perf_counter()
+        self._last_report = self._start_time
+        self.cnt = 0
+        self.cnt_feasible = 0
+
+    def update(self, result: Result) -> None:
+        self.cnt += 1
+        self.cnt_feasible += result["status"] == "optimal"
+        now = time.perf_counter()
+        if self._interval > 0 and now - self._last_report >= self._interval:
+            self._last_report = now
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        elapsed_time = time.perf_counter() - self._start_time
+        throughput = self.cnt / elapsed_time if elapsed_time > 0 else 0.0
+        prefix = "done: " if final else ""
+        print(
+            f"{prefix}{self.cnt} profiles ({self.cnt_feasible} feasible) "
+            f"in {elapsed_time:.1f} s, {throughput:.1f} profiles/s",
+            file=self._stream,
+            flush=True,
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="optbyes", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("input", help='the profile file ("-" for the standard input)')
+    parser.add_argument("--format", choices=FORMATS, default=None, help="decided from the extension by default")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="graph")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--output", "-o", default="-", help='the result file ("-" for the standard output)')
+    parser.add_argument("--schedule", action="store_true", help="include the schedules in the results")
+    parser.add_argument("--progress-interval", type=float, default=10.0, help="seconds (0 to disable)")
+    parser.add_argument(
+        "--tuned-params",
+        default=None,
+        help="the tuned Gurobi parameter file (see optbyes tuning) for --algorithm gurobi",
+    )
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None and args.input == "-":
+        fmt = "jsonl"
+    profiles = read_profiles(args.input, fmt)
+    results = solve_profiles(profiles, args.algorithm, args.workers, args.chunk_size, args.schedule, args.tuned_params)
+    progress = _ProgressReporter(args.progress_interval)
+    with contextlib.ExitStack() as stack:
+        if args.output == "-":
+            # Gurobi writes its license banner to the file descriptor 1, so it is pointed to stderr
+            # (also in the workers, which inherit it) and the results go to a duplicate of the original stdout.
+            sys.stdout.flush()
+            out: IO[str] = stack.enter_context(os.fdopen(os.dup(1), "w"))
+            saved_fd = os.dup(1)
+            os.dup2(2, 1)
+            stack.callback(os.close, saved_fd)
+            stack.callback(os.dup2, saved_fd, 1)
+        else:
+            out = stack.enter_context(open(args.output, "w"))
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+            progress.update(result)
+        out.flush()
+    if args.progress_interval > 0:
+        progress.report(final=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import optbyes as opb
+from optbyes import cli
+from optbyes.utils import generator
+from optbyes.utils.priority_array import PriorityArray, PriorityArrayFile
+
+
+def _profiles() -> list[PriorityArray]:
+    return [PriorityArray.from_team_priority(tp) for tp in generator.generate_team_priorities(4, 2)]
+
+
+def _expected(priority: PriorityArray) -> tuple[str, int | None]:
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(priority)
+    solver.solve()
+    if solver.get_status() != opb.OPTIMAL:
+        return "infeasible", None
+    return "optimal", solver.get_num_rounds()
+
+
+def _read_results(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("fmt", cli.FORMATS)
+def test_cli_formats(tmp_path: Path, fmt: str) -> None:
+    profiles = _profiles()
+    path = tmp_path / f"profiles.{fmt}"
+    if fmt == "jsonl":
+        with open(path, "w") as f:
+            for k, pa in enumerate(profiles):
+                f.write(json.dumps({"id": f"p{k}", "team_priority": pa.to_team_priority()}) + "\n")
+    elif fmt == "csv":
+        np.savetxt(path, np.stack([pa.array for pa in profiles]).reshape(len(profiles), -1), fmt="%d", delimiter=",")
+    else:
+        with PriorityArrayFile.create(path, num_teams=4) as f:
+            f.append(np.stack([pa.array for pa in profiles]))
+
+    output = tmp_path / "results.jsonl"
+    cli.main([str(path), "--output", str(output), "--chunk-size", "7", "--progress-interval", "0"])
+    results = _read_results(output)
+    assert [r["index"] for r in results] == list(range(len(profiles)))
+    for result, pa in zip(results, profiles):
+        assert (result["status"], result["num_rounds"]) == _expected(pa)
+        if fmt == "jsonl":
+            assert result["id"] == f"p{result['index']}"
+
+
+@pytest.mark.parametrize("algorithm", ["graph", "gurobi"])
+def test_cli_workers(tmp_path: Path, algorithm: str) -> None:
+    profiles = _profiles()
+    path = tmp_path / "profiles.jsonl"
+    with open(path, "w") as f:
+        for pa in profiles:
+            f.write(json.dumps(pa.array.tolist()) + "\n")
+    output = tmp_path / "results.jsonl"
+    cli.main(
+        [str(path), "-o", str(output), "--algorithm", algorithm, "--workers", "2", "--chunk-size", "5", "--schedule"]
+    )
+    results = _read_results(output)
+    assert [r["index"] for r in results] == list(range(len(profiles)))
+    for result, pa in zip(results, profiles):
+        assert (result["status"], result["num_rounds"]) == _expected(pa)
+        if result["status"] == "optimal":
+            assert len(result["schedule"]["1"]) == result["num_rounds"]
@@ -1,15 +1,21 @@
 import networkx as nx
+import numpy as np
 
 import optbyes as opb
+from optbyes.utils.priority_array import PriorityArray, TeamPriorityLike
 
 __all__ = [
     "convert_team_priority_to_team_priority_array",
+    "convert_team_priority_array_to_team_priority",
+    "convert_priority_array_to_team_priority",
+    "convert_team_priority_to_priority_array",
     "convert_team_priority_to_edges",
     "convert_team_priority_to_graph",
+    "convert_graph_to_team_priority",
 ]
 
 
-def convert_team_priority_to_team_priority_array(team_priority: opb.TeamPriority) -> opb.TeamPriorityArray:
+def convert_team_priority_to_team_priority_array(team_priority: TeamPriorityLike) -> opb.TeamPriorityArray:
     """Generate TeamPriorityArray from team_priority
 
     Generate parameters such that 1 if team k plays team i before team j
@@ -17,7 +23,7 @@ def convert_team_priority_to_team_priority_array(team_priority: opb.TeamPriority
 
     Parameters
     -----
-    team_priority: opb.TeamPriority
+    team_priority: TeamPriorityLike
         A dictionary of the team's desired priority order
 
     Returns
@@ -45,12 +51,78 @@ def convert_team_priority_to_team_priority_array(team_priority: opb.TeamPriority
     return team_priority_array
 
 
-def convert_team_priority_to_edges(team_priority: opb.TeamPriority) -> list[opb.OpbEdge]:
+def convert_team_priority_array_to_team_priority(
+    num_teams: int, team_priority_array: opb.TeamPriorityArray
+) -> opb.TeamPriority:
+    """Restore team_priority from TeamPriorityArray
+
+    Team k plays team i before team j iff team_priority_array[k, i, j] = 1,
+    so the opposing teams of team k are sorted by the number of teams they are played before.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    team_priority_array: opb.TeamPriorityArray
+        Parameters such that 1 if team k plays team i before team j
+        (team_priority_array[k, i, j] = 1), 0 otherwise.
+
+    Returns
+    -----
+    team_priority: opb.TeamPriority
+        A dictionary of the team's desired priority order
+    """
+    team_priority: opb.TeamPriority = {}
+    teams = range(1, num_teams + 1)
+    for k in teams:
+        num_later = {i: sum(team_priority_array[k, i, j] for j in teams) for i in teams if i != k}
+        team_priority[k] = tuple(sorted(num_later, key=lambda i: -num_later[i]))
+    return team_priority
+
+
+def convert_priority_array_to_team_priority(priority_array: np.ndarray | PriorityArray) -> opb.TeamPriority:
+    """Convert the array generated by optbyes.utils.generator to team_priority
+
+    Parameters
+    -----
+    priority_array: np.ndarray | PriorityArray
+        The num_teams x (num_teams - 1) array whose row t - 1 is the opposing teams of team t
+
+    Returns
+    -----
+    team_priority: opb.TeamPriority
+        A dictionary of the team's desired priority order
+    """
+    if isinstance(priority_array, PriorityArray):
+        return priority_array.to_team_priority()
+    return {t: tuple(row) for t, row in enumerate(priority_array.tolist(), 1)}
+
+
+def convert_team_priority_to_priority_array(team_priority: TeamPriorityLike) -> PriorityArray:
+    """Encode team_priority as a PriorityArray (returned as is if it already is one)
+
+    Parameters
+    -----
+    team_priority: TeamPriorityLike
+        A dictionary of the team's desired priority order
+
+    Returns
+    -----
+    priority_array: PriorityArray
+        The compact encoding of team_priority
+    """
+    if isinstance(team_priority, PriorityArray):
+        return team_priority
+    return PriorityArray.from_team_priority(team_priority)
+
+
+def convert_team_priority_to_edges(team_priority: TeamPriorityLike) -> list[opb.OpbEdge]:
     """Create an edge set based on the team_priority
 
     Prameters
     -----
-    team_priority: opb.TeamPriority
+    team_priority: TeamPriorityLike
         A dictionary of the team's desired priority order
 
     Returns
@@ -75,12 +147,12 @@ def convert_team_priority_to_edges(team_priority: opb.TeamPriority) -> list[opb.
     return edges
 
 
-def convert_team_priority_to_graph(team_priority: opb.TeamPriority) -> nx.DiGraph:
+def convert_team_priority_to_graph(team_priority: TeamPriorityLike) -> nx.DiGraph:
     """Create directed graph expressing team_priority
 
     Parameters
     -----
-    team_priority: opb.TeamPriority
+    team_priority: TeamPriorityLike
         A dictionary of the team's desired priority order
 
     Returns
@@ -95,3 +167,37 @@ def convert_team_priority_to_graph(team_priority: opb.TeamPriority) -> nx.DiGrap
     edges = convert_team_priority_to_edges(team_priority)
     G.add_edges_from(edges, color=opb.EDGE_COLOR)
     return G
+
+
+def convert_graph_to_team_priority(num_teams: int, G: nx.DiGraph) -> opb.TeamPriority:
+    """Restore team_priority from the directed graph expressing it
+
+    The matches of team t form a chain along the edges between them, which is its priority order.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    G: nx.DiGraph
+        Directed graph expressing team_priority (see convert_team_priority_to_graph())
+
+    Returns
+    -----
+    team_priority: opb.TeamPriority
+        A dictionary of the team's desired priority order
+    """
+    team_priority: opb.TeamPriority = {}
+    for t in range(1, num_teams + 1):
+        nodes = [(min(t, j), max(t, j)) for j in range(1, num_teams + 1) if j != t]
+        succ = {u: [v for v in G.successors(u) if t in v] for u in nodes}
+        heads = set(nodes) - {v for vs in succ.values() for v in vs}
+        if len(heads) != 1 or any(len(vs) > 1 for vs in succ.values()):
+            raise ValueError(f"The matches of team {t} do not form a chain in the graph.")
+        chain = [heads.pop()]
+        while succ[chain[-1]] and len(chain) < len(nodes):
+            chain.append(succ[chain[-1]][0])
+        if len(chain) != len(nodes):
+            raise ValueError(f"The matches of team {t} do not form a chain in the graph.")
+        team_priority[t] = tuple(i if i != t else j for i, j in chain)
+    return team_priority
@@ -1,9 +1,18 @@
 import itertools
+import math
+
+import numpy as np
 
 import optbyes as opb
+from optbyes.utils.priority_array import PRIORITY_ARRAY_DTYPE, PriorityArray
 
 __all__ = [
     "generate_team_priorities",
+    "count_team_priorities",
+    "unrank_team_priority",
+    "generate_random_priority_array",
+    "generate_feasible_priority_array",
+    "generate_near_feasible_priority_array",
 ]
 
 
@@ -61,3 +70,200 @@ def generate_team_priorities(num_teams: int, num_fixed: int = 0) -> list[opb.Tea
             team_priority[i] = s  # type: ignore
         team_priorities.append(team_priority)
     return team_priorities
+
+
+def count_team_priorities(num_teams: int, num_fixed: int = 0) -> int:
+    """Count the team priority combinations generated by generate_team_priorities().
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+    num_fixed: int, optional (default = 0)
+        The number of teams to fix priorities. Defaults to 0.
+
+    Returns
+    -----
+    num_team_priorities: int
+        ((num_teams - 1)!)^(num_teams - num_fixed)
+    """
+    if num_fixed > num_teams:
+        raise ValueError("num_fixed must be less than num_teams.")
+    return int(math.factorial(num_teams - 1) ** (num_teams - num_fixed))
+
+
+def unrank_team_priority(num_teams: int, rank: int, num_fixed: int = 0) -> opb.TeamPriority:
+    """Generate the team priority at position rank of generate_team_priorities().
+
+    The rank is read as a mixed radix number with one digit per flexible team
+    (the last team varies fastest), and each digit is decoded with the factorial
+    number system into the lexicographic permutation of the opposing teams.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+    rank: int
+        The position in generate_team_priorities(num_teams, num_fixed) (0-indexed)
+    num_fixed: int, optional (default = 0)
+        The number of teams to fix priorities. Defaults to 0.
+
+    Returns
+    -----
+    team_priority: opb.TeamPriority
+        A dictionary of the team's desired priority order
+
+    Examples
+    -----
+    >>> unrank_team_priority(3, 1)
+    >>> {1: (2, 3), 2: (1, 3), 3: (2, 1)}
+    """
+    if not 0 <= rank < count_team_priorities(num_teams, num_fixed):
+        raise ValueError("rank is out of range.")
+
+    num_perms = math.factorial(num_teams - 1)
+    team_priority: opb.TeamPriority = {}
+    for t in range(num_teams, 0, -1):
+        opposing_teams = [i for i in range(1, num_teams + 1) if i != t]
+        if t <= num_fixed:
+            team_priority[t] = tuple(opposing_teams)
+            continue
+        rank, perm_rank = divmod(rank, num_perms)
+        perm = []
+        for k in range(num_teams - 2, -1, -1):
+            idx, perm_rank = divmod(perm_rank, math.factorial(k))
+            perm.append(opposing_teams.pop(idx))
+        team_priority[t] = tuple(perm)
+    return dict(sorted(team_priority.items()))
+
+
+def _check_priority_array_size(num_teams: int) -> None:
+    if not 2 <= num_teams <= np.iinfo(PRIORITY_ARRAY_DTYPE).max:
+        raise ValueError(f"num_teams must be in [2, {np.iinfo(PRIORITY_ARRAY_DTYPE).max}].")
+
+
+def _write(array: np.ndarray, out: np.ndarray | PriorityArray | None) -> np.ndarray:
+    if out is None:
+        return array
+    out_array = out.array if isinstance(out, PriorityArray) else out
+    out_array[...] = array
+    return out_array
+
+
+def generate_random_priority_array(
+    num_teams: int, seed: int | np.random.Generator | None = None, out: np.ndarray | PriorityArray | None = None
+) -> np.ndarray:
+    """Generate a uniformly random team priority as an array.
+
+    Every team gets a uniformly random permutation of its opposing teams.
+    For large num_teams such priorities are almost always infeasible.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+    seed: int | np.random.Generator | None, optional (default = None)
+        The seed (or the generator) of the random numbers
+    out: np.ndarray | PriorityArray | None, optional (default = None)
+        The num_teams x (num_teams - 1) array (or the PriorityArray) the priority is written into
+
+    Returns
+    -----
+    priority_array: np.ndarray
+        The num_teams x (num_teams - 1) uint16 array whose row t - 1 is the opposing teams of team t
+    """
+    _check_priority_array_size(num_teams)
+    rng = np.random.default_rng(seed)
+    teams = np.arange(1, num_teams + 1, dtype=PRIORITY_ARRAY_DTYPE)[:, np.newaxis]
+    opposing_teams = np.arange(1, num_teams, dtype=PRIORITY_ARRAY_DTYPE)[np.newaxis, :]
+    priority_array = opposing_teams + (opposing_teams >= teams).astype(PRIORITY_ARRAY_DTYPE)
+    rng.permuted(priority_array, axis=1, out=priority_array)
+    return _write(priority_array, out)
+
+
+def generate_feasible_priority_array(
+    num_teams: int, seed: int | np.random.Generator | None = None, out: np.ndarray | PriorityArray | None = None
+) -> np.ndarray:
+    """Generate a feasible team priority as an array.
+
+    A random round robin schedule is created by the circle method with randomly relabeled teams
+    and randomly ordered rounds, and each team prefers its opposing teams in the order of the schedule.
+    So the priority is feasible in num_teams - 1 (even) or num_teams (odd) rounds.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+    seed: int | np.random.Generator | None, optional (default = None)
+        The seed (or the generator) of the random numbers
+    out: np.ndarray | PriorityArray | None, optional (default = None)
+        The num_teams x (num_teams - 1) array (or the PriorityArray) the priority is written into
+
+    Returns
+    -----
+    priority_array: np.ndarray
+        The num_teams x (num_teams - 1) uint16 array whose row t - 1 is the opposing teams of team t
+    """
+    _check_priority_array_size(num_teams)
+    rng = np.random.default_rng(seed)
+    m = num_teams + num_teams % 2  # with a dummy team for odd num_teams
+    dtype = np.int32
+
+    # Circle method: in round r, team i (< m - 1) plays team (r - i) mod (m - 1),
+    # or team m - 1 if it is i itself (2i = r mod (m - 1)).
+    rounds = rng.permutation(m - 1).astype(dtype)[np.newaxis, :]
+    circle = np.arange(m - 1, dtype=dtype)[:, np.newaxis]
+    opponents = np.empty((m, m - 1), dtype=dtype)
+    opponents[:-1] = (rounds - circle) % (m - 1)
+    opponents[:-1][opponents[:-1] == circle] = m - 1
+    opponents[-1] = (rounds[0] * (m // 2)) % (m - 1)  # m // 2 is the inverse of 2 modulo m - 1
+
+    # Relabel the teams randomly (the dummy team becomes team m).
+    labels = rng.permutation(m).astype(dtype) + 1
+    priority_array = np.empty((m, m - 1), dtype=dtype)
+    priority_array[labels - 1] = labels[opponents]
+    del opponents
+    if m != num_teams:
+        priority_array = priority_array[:num_teams][priority_array[:num_teams] != m].reshape(num_teams, -1)
+    return _write(priority_array.astype(PRIORITY_ARRAY_DTYPE), out)
+
+
+def generate_near_feasible_priority_array(
+    num_teams: int,
+    num_swaps: int,
+    seed: int | np.random.Generator | None = None,
+    out: np.ndarray | PriorityArray | None = None,
+) -> np.ndarray:
+    """Generate a near-feasible team priority as an array.
+
+    A feasible priority (generate_feasible_priority_array()) is perturbed by num_swaps swaps,
+    each of which exchanges two distinct random opposing teams in the priority of a random team.
+    With num_teams = 2, the priority of a team is a single opposing team, so no swap is injected.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+    num_swaps: int
+        The number of swaps injected
+    seed: int | np.random.Generator | None, optional (default = None)
+        The seed (or the generator) of the random numbers
+    out: np.ndarray | PriorityArray | None, optional (default = None)
+        The num_teams x (num_teams - 1) array (or the PriorityArray) the priority is written into
+
+    Returns
+    -----
+    priority_array: np.ndarray
+        The num_teams x (num_teams - 1) uint16 array whose row t - 1 is the opposing teams of team t
+    """
+    rng = np.random.default_rng(seed)
+    priority_array = generate_feasible_priority_array(num_teams, rng, out)
+    if num_teams < 3:
+        return priority_array
+    teams = rng.integers(num_teams, size=num_swaps)
+    # q is drawn from the positions other than p, so that every swap changes the priority.
+    first_positions = rng.integers(num_teams - 1, size=num_swaps)
+    second_positions = (first_positions + rng.integers(1, num_teams - 1, size=num_swaps)) % (num_teams - 1)
+    for t, p, q in zip(teams, first_positions, second_positions):
+        priority_array[t, p], priority_array[t, q] = priority_array[t, q], priority_array[t, p]
+    return priority_array
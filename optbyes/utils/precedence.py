@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+
+import optbyes as opb
+from optbyes.utils.priority_array import PriorityArray, TeamPriorityLike
+
+__all__ = [
+    "match_index",
+    "convert_team_priority_to_adjacency",
+    "convert_graph_to_adjacency",
+    "compute_longest_paths",
+    "CriticalPathAnalysis",
+]
+
+
+def match_index(num_teams: int, i: int, j: int) -> int:
+    """Return the index of the match (i, j) (i < j) in [(1, 2), (1, 3), ..., (num_teams - 1, num_teams)]"""
+    return (i - 1) * (2 * num_teams - i) // 2 + (j - i - 1)
+
+
+def convert_team_priority_to_adjacency(team_priority: TeamPriorityLike) -> tuple[np.ndarray, np.ndarray]:
+    """Create the array-backed adjacency of the match precedence graph
+
+    A match (i, j) (i < j) has at most two predecessors (the previous matches of team i and team j)
+    and at most two successors (the next matches of team i and team j).
+    Column 0 is along the priority of team i, and column 1 is along the priority of team j.
+
+    Parameters
+    -----
+    team_priority: TeamPriorityLike
+        A dictionary of the team's desired priority order (a PriorityArray is converted without loops)
+
+    Returns
+    -----
+    pred: np.ndarray
+        The num_matches x 2 array of the predecessor indices (-1 if none)
+    succ: np.ndarray
+        The num_matches x 2 array of the successor indices (-1 if none)
+    """
+    num_teams = len(team_priority)
+    num_matches = num_teams * (num_teams - 1) // 2
+    pred = np.full((num_matches, 2), -1, dtype=np.int64)
+    succ = np.full((num_matches, 2), -1, dtype=np.int64)
+    if isinstance(team_priority, PriorityArray):
+        opposing = team_priority.array.astype(np.int64)
+        teams = np.arange(1, num_teams + 1)[:, np.newaxis]
+        i, j = np.minimum(teams, opposing), np.maximum(teams, opposing)
+        match_nodes = (i - 1) * (2 * num_teams - i) // 2 + (j - i - 1)  # match_index() element-wise
+        match_columns = (teams > opposing).astype(np.int64)
+        pred[match_nodes[:, 1:], match_columns[:, 1:]] = match_nodes[:, :-1]
+        succ[match_nodes[:, :-1], match_columns[:, :-1]] = match_nodes[:, 1:]
+        return pred, succ
+    for t, opposing_teams in team_priority.items():
+        nodes = [match_index(num_teams, min(t, j), max(t, j)) for j in opposing_teams]
+        columns = [int(t > j) for j in opposing_teams]
+        for a in range(len(nodes) - 1):
+            pred[nodes[a + 1], columns[a + 1]] = nodes[a]
+            succ[nodes[a], columns[a]] = nodes[a + 1]
+    return pred, succ
+
+
+def convert_graph_to_adjacency(num_teams: int, G: nx.DiGraph) -> tuple[np.ndarray, np.ndarray]:
+    """Create the array-backed adjacency (see convert_team_priority_to_adjacency()) from the precedence graph
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    G: nx.DiGraph
+        Graph experssing team priority (the nodes are the matches (i, j) with i < j)
+
+    Returns
+    -----
+    pred: np.ndarray
+        The num_matches x 2 array of the predecessor indices (-1 if none)
+    succ: np.ndarray
+        The num_matches x 2 array of the successor indices (-1 if none)
+    """
+    num_matches = num_teams * (num_teams - 1) // 2
+    pred = np.full((num_matches, 2), -1, dtype=np.int64)
+    succ = np.full((num_matches, 2), -1, dtype=np.int64)
+    for (a, b), (c, d) in G.edges:
+        # The edge is along the priority of the team playing both matches.
+        t = a if a in (c, d) else b
+        u, v = match_index(num_teams, a, b), match_index(num_teams, c, d)
+        succ[u, int(t == b)] = v
+        pred[v, int(t == d)] = u
+    return pred, succ
+
+
+def _topological_order(pred: np.ndarray, succ_list: list[list[int]]) -> list[int]:
+    """Return the matches in a topological order by Kahn's algorithm (the matches on a cycle are left out)"""
+    indegree = (pred >= 0).sum(axis=1).tolist()
+    order = [u for u in range(len(pred)) if indegree[u] == 0]
+    for u in order:  # order grows while iterating
+        for v in succ_list[u]:
+            if v >= 0:
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order.append(v)
+    return order
+
+
+def compute_longest_paths(pred: np.ndarray, succ: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Compute the longest paths through every match in O(V + E)
+
+    Parameters
+    -----
+    pred: np.ndarray
+        The num_matches x 2 array of the predecessor indices (-1 if none)
+    succ: np.ndarray
+        The num_matches x 2 array of the successor indices (-1 if none)
+
+    Returns
+    -----
+    head: np.ndarray
+        The number of matches on the longest path ending at each match,
+        i.e., the earliest round of the match
+    tail: np.ndarray
+        The number of matches on the longest path starting at each match,
+        i.e., the match must be played at the latest in round num_rounds - tail + 1
+    None is returned if the precedence graph has a cycle.
+    """
+    num_matches = len(pred)
+    succ_list = succ.tolist()
+    order = _topological_order(pred, succ_list)
+    if len(order) != num_matches:
+        return None
+
+    head = [1] * num_matches
+    tail = [1] * num_matches
+    for u in order:
+        for v in succ_list[u]:
+            if v >= 0 and head[v] <= head[u]:
+                head[v] = head[u] + 1
+    for u in reversed(order):
+        for v in succ_list[u]:
+            if v >= 0 and tail[u] <= tail[v]:
+                tail[u] = tail[v] + 1
+    return np.array(head, dtype=np.int64), np.array(tail, dtype=np.int64)
+
+
+class CriticalPathAnalysis:
+    """Critical path analytics of the match precedence graph
+
+    The longest paths through every match are computed once in O(V + E) over the array-backed adjacency.
+    The arrays are indexed by match_index(), i.e., in the order of get_matches().
+    If the precedence graph has a cycle, is_acyclic() is False and the getters raise InfeasibleInstanceError.
+
+    Use CriticalPathAnalysis.create_from_team_priority() or create_from_graph() instead of the constructor.
+
+    Parameters
+    -----
+    num_teams: int
+        The number of teams
+
+    pred: np.ndarray
+        The num_matches x 2 array of the predecessor indices (-1 if none)
+
+    succ: np.ndarray
+        The num_matches x 2 array of the successor indices (-1 if none)
+    """
+
+    def __init__(self, num_teams: int, pred: np.ndarray, succ: np.ndarray) -> None:
+        self._num_teams = num_teams
+        self._pred = pred
+        self._succ = succ
+        longest_paths = compute_longest_paths(pred, succ)
+        self._head: np.ndarray | None = None
+        self._tail: np.ndarray | None = None
+        if longest_paths is not None:
+            self._head, self._tail = longest_paths
+
+    @classmethod
+    def create_from_team_priority(cls, team_priority: TeamPriorityLike) -> CriticalPathAnalysis:
+        return cls(len(team_priority), *convert_team_priority_to_adjacency(team_priority))
+
+    @classmethod
+    def create_from_graph(cls, num_teams: int, G: nx.DiGraph) -> CriticalPathAnalysis:
+        return cls(num_teams, *convert_graph_to_adjacency(num_teams, G))
+
+    def is_acyclic(self) -> bool:
+        return self._head is not None
+
+    def _get_longest_paths(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._head is None or self._tail is None:
+            raise opb.ERRORS[opb.INFEASIBLE]
+        return self._head, self._tail
+
+    def get_adjacency(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the (pred, succ) arrays (see convert_team_priority_to_adjacency())"""
+        return self._pred, self._succ
+
+    def get_matches(self) -> list[opb.OpbNode]:
+        """Return the matches in the order of the arrays"""
+        return [(i, j) for i in range(1, self._num_teams) for j in range(i + 1, self._num_teams + 1)]
+
+    def get_lower_bound(self) -> int:
+        """Return the critical path length, i.e., the minimum number of rounds"""
+        head, _ = self._get_longest_paths()
+        return int(head.max(initial=0))
+
+    def get_earliest_rounds(self) -> np.ndarray:
+        """Return the earliest round of each match"""
+        head, _ = self._get_longest_paths()
+        return head
+
+    def get_latest_rounds(self, num_rounds: int | None = None) -> np.ndarray:
+        """Return the latest round of each match in a schedule with num_rounds rounds
+
+        If num_rounds is None, the lower bound is used.
+        """
+        _, tail = self._get_longest_paths()
+        if num_rounds is None:
+            num_rounds = self.get_lower_bound()
+        return num_rounds - tail + 1
+
+    def get_slacks(self, num_rounds: int | None = None) -> np.ndarray:
+        """Return the number of rounds each match can be delayed from its earliest round
+
+        The slack is negative if the match can not be played within num_rounds.
+        """
+        slacks: np.ndarray = self.get_latest_rounds(num_rounds) - self.get_earliest_rounds()
+        return slacks
+
+    def get_critical_chain(self) -> list[opb.OpbNode]:
+        """Return a longest chain of matches, which determines the number of rounds"""
+        head, _ = self._get_longest_paths()
+        if len(head) == 0:
+            return []
+        matches = self.get_matches()
+        u = int(head.argmax())
+        chain = [u]
+        while head[u] > 1:
+            # A predecessor on a longest path ending at u is one round earlier.
+            u = next(int(v) for v in self._pred[u] if v >= 0 and head[v] == head[u] - 1)
+            chain.append(u)
+        return [matches[u] for u in reversed(chain)]
+
+    def get_team_earliest_finish(self) -> dict[int, int]:
+        """Return the earliest round in which each team can play its last match"""
+        head, _ = self._get_longest_paths()
+        finish = np.zeros(self._num_teams + 1, dtype=np.int64)
+        teams = np.array(self.get_matches(), dtype=np.int64).reshape(-1, 2)
+        np.maximum.at(finish, teams[:, 0], head)
+        np.maximum.at(finish, teams[:, 1], head)
+        return {t: int(finish[t]) for t in range(1, self._num_teams + 1)}
@@ -0,0 +1,307 @@
+"""
+Compact binary encoding of team priorities
+
+PriorityArray wraps the num_teams x (num_teams - 1) uint16 array
+whose row t - 1 is the opposing teams of team t (the arrays of optbyes.utils.generator),
+and is a read-only Mapping view of the same team priority,
+so it can be passed wherever opb.TeamPriority is read without building the dictionary.
+It pickles as a single array, serializes to bytes with a fixed header,
+and has a canonical hash invariant under relabeling the teams.
+
+PriorityArrayFile stores many priorities of the same num_teams in one appendable file,
+which is read through a memory map.
+
+Examples
+-----
+>>> pa = PriorityArray.from_team_priority({1: (2, 3), 2: (3, 1), 3: (1, 2)})
+>>> pa[2]
+>>> (3, 1)
+>>> with PriorityArrayFile.create("profiles.bin", num_teams=3) as f:
+...     f.append(pa)
+>>> with PriorityArrayFile.open("profiles.bin") as f:
+...     len(f), f[0] == pa
+>>> (1, True)
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Callable, Iterator, Union
+
+import numpy as np
+
+import optbyes as opb
+
+__all__ = [
+    "PRIORITY_ARRAY_DTYPE",
+    "PriorityArray",
+    "PriorityArrayFile",
+    "TeamPriorityLike",
+]
+
+# The priority arrays are num_teams x (num_teams - 1) arrays of this type,
+# whose row t - 1 is the opposing teams of team t in its desired order.
+PRIORITY_ARRAY_DTYPE = np.uint16
+
+_VERSION = 1
+_ARRAY_MAGIC = b"OPBPRIO\x00"
+_ARRAY_HEADER = struct.Struct("<8sII")  # magic, version, num_teams
+_FILE_MAGIC = b"OPBPRIOS"
+_FILE_HEADER = struct.Struct("<8sIIQ")  # magic, version, num_teams, num_profiles
+_FILE_HEADER_SIZE = 64
+
+_MASK = (1 << 64) - 1
+_K1 = np.uint64(0x9E3779B97F4A7C15)
+_K2 = np.uint64(0xC2B2AE3D27D4EB4F)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (element-wise on uint64 arrays)"""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    mixed: np.ndarray = x ^ (x >> np.uint64(31))
+    return mixed
+
+
+class PriorityArray(Mapping[int, opb.OpposingTeams]):
+    """Team priority backed by a num_teams x (num_teams - 1) uint16 array
+
+    Parameters
+    -----
+    array: np.ndarray
+        The num_teams x (num_teams - 1) array whose row t - 1 is the opposing teams of team t.
+        It is not copied if it is already a uint16 array.
+
+    validate: bool, optional (default = True)
+        Whether to check that every row contains each opposing team once
+    """
+
+    __slots__ = ("_array",)
+
+    def __init__(self, array: np.ndarray, validate: bool = True) -> None:
+        array = np.asarray(array, dtype=PRIORITY_ARRAY_DTYPE)
+        if array.ndim != 2 or array.shape[1] != array.shape[0] - 1 or array.shape[0] < 2:
+            raise ValueError("The priority array must be a num_teams x (num_teams - 1) array.")
+        if validate:
+            num_teams = array.shape[0]
+            teams = np.arange(1, num_teams + 1)[:, np.newaxis]
+            expected = np.arange(1, num_teams)[np.newaxis, :]
+            expected = expected + (expected >= teams)
+            if not (np.sort(array, axis=1) == expected).all():
+                raise ValueError("Every row must contain each opposing team once.")
+        self._array = array
+
+    @classmethod
+    def from_team_priority(cls, team_priority: opb.TeamPriority) -> PriorityArray:
+        """Encode team_priority (the teams must be 1, ..., num_teams)"""
+        num_teams = len(team_priority)
+        array = np.empty((num_teams, num_teams - 1), dtype=PRIORITY_ARRAY_DTYPE)
+        for t in range(1, num_teams + 1):
+            array[t - 1] = team_priority[t]
+        return cls(array)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, validate: bool = True) -> PriorityArray:
+        """Decode the bytes of to_bytes() (without copying the array)"""
+        magic, version, num_teams = _ARRAY_HEADER.unpack_from(data, 0)
+        if magic != _ARRAY_MAGIC or version != _VERSION:
+            raise ValueError("The data is not a priority array.")
+        array = np.frombuffer(
+            data, dtype=PRIORITY_ARRAY_DTYPE, count=num_teams * (num_teams - 1), offset=_ARRAY_HEADER.size
+        )
+        return cls(array.reshape(num_teams, num_teams - 1), validate)
+
+    def to_bytes(self) -> bytes:
+        """Encode to the fixed header (magic, version, num_teams) and the little-endian array"""
+        header = _ARRAY_HEADER.pack(_ARRAY_MAGIC, _VERSION, self.num_teams)
+        return header + self._array.astype("<u2", copy=False).tobytes()
+
+    def to_team_priority(self) -> opb.TeamPriority:
+        return {t: tuple(row) for t, row in enumerate(self._array.tolist(), 1)}
+
+    @property
+    def num_teams(self) -> int:
+        return int(self._array.shape[0])
+
+    @property
+    def array(self) -> np.ndarray:
+        """The underlying array (not a copy)"""
+        return self._array
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None) -> np.ndarray:
+        if dtype is None and not copy:
+            return self._array
+        return np.array(self._array, dtype=dtype, copy=True)
+
+    def __getitem__(self, team: int) -> opb.OpposingTeams:
+        if not (isinstance(team, int) and 1 <= team <= self.num_teams):
+            raise KeyError(team)
+        return tuple(self._array[team - 1].tolist())
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, self.num_teams + 1))
+
+    def __len__(self) -> int:
+        return self.num_teams
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PriorityArray):
+            return bool(np.array_equal(self._array, other._array))
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        # Equal priorities hash equally, as long as the labels of the teams are the same.
+        return hash(self._array.tobytes())
+
+    def __reduce__(self) -> tuple[Callable[[bytes, bool], PriorityArray], tuple[bytes, bool]]:
+        # Pickle the compact encoding rather than the generic ndarray reduction.
+        return PriorityArray.from_bytes, (self.to_bytes(), False)
+
+    def __repr__(self) -> str:
+        return f"PriorityArray({self.to_team_priority()})"
+
+    def canonical_hash(self) -> int:
+        """Return a 64-bit hash invariant under relabeling the teams
+
+        The teams are colored by Weisfeiler-Lehman style refinement:
+        the new color of a team combines its color with the sequence of
+        (the color of the opposing team, the position of the team in the priority of the opposing team)
+        in its priority order, until the number of colors stops growing.
+        The hash is computed from the sorted colors, so isomorphic priorities have the same hash.
+        Like any refinement, non-isomorphic priorities may rarely collide.
+
+        Returns
+        -----
+        h: int
+            The canonical hash in [0, 2^64)
+        """
+        num_teams = self.num_teams
+        opponents = self._array.astype(np.int64) - 1
+        teams = np.arange(num_teams)[:, np.newaxis]
+        positions = np.broadcast_to(np.arange(num_teams - 1), opponents.shape)
+        position_of = np.empty((num_teams, num_teams), dtype=np.int64)
+        position_of[teams, opponents] = positions
+        # reverse_positions[t, p] is the position of team t in the priority of its p-th opposing team.
+        reverse_positions = (position_of[opponents, teams] + 1).astype(np.uint64)
+
+        colors = np.zeros(num_teams, dtype=np.uint64)
+        num_colors = 1
+        for _ in range(num_teams):
+            elements = _mix(colors[opponents] * _K1 + reverse_positions)
+            new_colors = _mix(colors + _K2)
+            for p in range(num_teams - 1):
+                new_colors = _mix(new_colors * _K2 + elements[:, p])
+            new_num_colors = len(np.unique(new_colors))
+            colors = new_colors
+            if new_num_colors == num_colors:
+                break
+            num_colors = new_num_colors
+
+        h = num_teams
+        for c in np.sort(colors).tolist():
+            h = int(_mix(np.array([(h * int(_K2) + c) & _MASK], dtype=np.uint64))[0])
+        return h
+
+
+TeamPriorityLike = Union[opb.TeamPriority, PriorityArray]
+
+
+class PriorityArrayFile:
+    """Appendable file of priority arrays with the same num_teams, read through a memory map
+
+    The file consists of a fixed header (magic, version, num_teams, the number of priorities)
+    and the priority arrays one after another. An append writes the arrays before updating the count,
+    so a crash never leaves a partial priority visible. Only one process may append at a time.
+
+    Use PriorityArrayFile.create() or PriorityArrayFile.open() instead of the constructor.
+    """
+
+    def __init__(self, path: str | Path, writable: bool) -> None:
+        self._path = Path(path)
+        self._writable = writable
+        self._file = open(self._path, "r+b" if writable else "rb")
+        magic, version, num_teams, num_profiles = _FILE_HEADER.unpack(self._file.read(_FILE_HEADER.size))
+        if magic != _FILE_MAGIC or version != _VERSION:
+            self._file.close()
+            raise ValueError(f"{path} is not a priority array file.")
+        self.num_teams: int = num_teams
+        self._num_profiles: int = num_profiles
+        self._profile_size = num_teams * (num_teams - 1) * np.dtype(PRIORITY_ARRAY_DTYPE).itemsize
+        self._memmap: np.memmap | None = None
+
+    @classmethod
+    def create(cls, path: str | Path, num_teams: int) -> PriorityArrayFile:
+        """Create an empty file for appending (an existing file is overwritten)"""
+        with open(path, "wb") as f:
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, _VERSION, num_teams, 0).ljust(_FILE_HEADER_SIZE, b"\0"))
+        return cls(path, writable=True)
+
+    @classmethod
+    def open(cls, path: str | Path, writable: bool = False) -> PriorityArrayFile:
+        """Open an existing file"""
+        return cls(path, writable)
+
+    def append(self, priorities: PriorityArray | np.ndarray) -> None:
+        """Append a priority array, or a num_profiles x num_teams x (num_teams - 1) batch of them"""
+        if not self._writable:
+            raise ValueError(f"{self._path} is opened read-only.")
+        array = np.asarray(priorities, dtype=PRIORITY_ARRAY_DTYPE)
+        if array.ndim == 2:
+            array = array[np.newaxis]
+        if array.shape[1:] != (self.num_teams, self.num_teams - 1):
+            raise ValueError(f"The priority arrays must be {self.num_teams} x {self.num_teams - 1} arrays.")
+        self._file.seek(_FILE_HEADER_SIZE + self._num_profiles * self._profile_size)
+        self._file.write(array.astype("<u2", copy=False).tobytes())
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._num_profiles += len(array)
+        self._file.seek(0)
+        self._file.write(_FILE_HEADER.pack(_FILE_MAGIC, _VERSION, self.num_teams, self._num_profiles))
+        self._file.flush()
+        self._memmap = None
+
+    def get_array(self) -> np.ndarray:
+        """Return the num_profiles x num_teams x (num_teams - 1) memory-mapped array of all priorities"""
+        if self._memmap is None:
+            if self._num_profiles == 0:
+                return np.empty((0, self.num_teams, self.num_teams - 1), dtype=PRIORITY_ARRAY_DTYPE)
+            self._memmap = np.memmap(
+                self._path,
+                dtype=np.dtype(PRIORITY_ARRAY_DTYPE).newbyteorder("<"),
+                mode="r",
+                offset=_FILE_HEADER_SIZE,
+                shape=(self._num_profiles, self.num_teams, self.num_teams - 1),
+            )
+        return self._memmap
+
+    def __len__(self) -> int:
+        return self._num_profiles
+
+    def __getitem__(self, index: int) -> PriorityArray:
+        return PriorityArray(self.get_array()[index], validate=False)
+
+    def __iter__(self) -> Iterator[PriorityArray]:
+        array = self.get_array()
+        for index in range(len(array)):
+            yield PriorityArray(array[index], validate=False)
+
+    def close(self) -> None:
+        self._memmap = None
+        self._file.close()
+
+    def __enter__(self) -> PriorityArrayFile:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
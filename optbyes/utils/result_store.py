@@ -0,0 +1,209 @@
+"""
+Memory-mapped result store of exhaustive experiments
+
+The results are indexed by the rank of the team priority (see generator.unrank_team_priority()).
+The file consists of a fixed header, a feasibility bitset (bit k % 8 of byte k // 8 is rank k)
+and a uint8 array of the number of rounds (0 if infeasible or not solved yet).
+Everything is accessed through mmap, so the file is never loaded into memory as a whole.
+
+Parallel workers may write to the same file through their own ResultStore,
+as long as their rank ranges are disjoint and start at multiples of 8
+(so that no two workers write bits of the same byte).
+
+Examples
+-----
+>>> with ResultStore.create("results.bin", num_profiles=1296) as store:
+...     store.write(0, 3)
+...     store.write(1, None)
+>>> with ResultStore.open("results.bin") as store:
+...     store.count_feasible(), list(store.iter_ranks_with_rounds(3))
+>>> (1, [0])
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator
+
+import numpy as np
+
+__all__ = [
+    "ResultStore",
+]
+
+_MAGIC = b"OPBRSLT\x00"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQII")  # magic, version, reserved, num_profiles, num_teams, num_fixed
+_HEADER_SIZE = 64
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _bitset_size(num_profiles: int) -> int:
+    # pad to 8 bytes so that the rounds array is aligned
+    return (num_profiles + 63) // 64 * 8
+
+
+class ResultStore:
+    """Feasibility bitset and round counts of team priorities, stored in a memory-mapped file
+
+    Use ResultStore.create() or ResultStore.open() instead of the constructor.
+    """
+
+    def __init__(self, path: str | Path, writable: bool) -> None:
+        self._path = Path(path)
+        self._writable = writable
+        self._file = open(self._path, "r+b" if writable else "rb")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        magic, version, _, num_profiles, num_teams, num_fixed = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a result store.")
+        self.num_profiles: int = num_profiles
+        self.num_teams: int = num_teams
+        self.num_fixed: int = num_fixed
+        self._bitset = np.frombuffer(self._mmap, dtype=np.uint8, count=_bitset_size(num_profiles), offset=_HEADER_SIZE)
+        self._rounds = np.frombuffer(
+            self._mmap, dtype=np.uint8, count=num_profiles, offset=_HEADER_SIZE + _bitset_size(num_profiles)
+        )
+
+    @classmethod
+    def create(cls, path: str | Path, num_profiles: int, num_teams: int = 0, num_fixed: int = 0) -> ResultStore:
+        """Create an empty store (or open the existing one) for writing
+
+        The file is written completely under a temporary name and then linked into place,
+        so workers creating the same store at once all open the same complete file.
+
+        Parameters
+        -----
+        path: str | Path
+            The file path
+        num_profiles: int
+            The number of team priorities (ranks 0, ..., num_profiles - 1)
+        num_teams: int, optional (default = 0)
+            The number of teams (recorded in the header)
+        num_fixed: int, optional (default = 0)
+            The number of teams fixing priorities (recorded in the header)
+
+        Returns
+        -----
+        store: ResultStore
+            The writable store
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, num_profiles, num_teams, num_fixed).ljust(_HEADER_SIZE, b"\0"))
+            f.truncate(_HEADER_SIZE + _bitset_size(num_profiles) + num_profiles)
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_path)
+        store = cls(path, writable=True)
+        if (store.num_profiles, store.num_teams, store.num_fixed) != (num_profiles, num_teams, num_fixed):
+            store.close()
+            raise ValueError(f"{path} already exists with a different size.")
+        return store
+
+    @classmethod
+    def open(cls, path: str | Path, writable: bool = False) -> ResultStore:
+        """Open an existing store"""
+        return cls(path, writable)
+
+    def _check_rank(self, rank: int) -> None:
+        if not 0 <= rank < self.num_profiles:
+            raise IndexError(f"rank {rank} is out of range.")
+
+    def write(self, rank: int, num_rounds: int | None) -> None:
+        """Record the result of the team priority (num_rounds is None if infeasible)"""
+        self._check_rank(rank)
+        byte, bit = divmod(rank, 8)
+        if num_rounds is None:
+            self._bitset[byte] &= ~np.uint8(1 << bit)
+            self._rounds[rank] = 0
+        else:
+            if not 1 <= num_rounds <= 255:
+                raise ValueError("num_rounds must be in [1, 255].")
+            self._bitset[byte] |= np.uint8(1 << bit)
+            self._rounds[rank] = num_rounds
+
+    def write_batch(self, start: int, rounds: np.ndarray) -> None:
+        """Record the results of the ranks start, start + 1, ... (rounds[k] = 0 if infeasible)
+
+        start must be a multiple of 8, and so must be len(rounds) unless the batch reaches the end.
+        """
+        stop = start + len(rounds)
+        if start % 8 != 0 or (stop % 8 != 0 and stop != self.num_profiles):
+            raise ValueError("The batch must be aligned to 8 ranks.")
+        self._check_rank(start)
+        self._check_rank(stop - 1)
+        self._rounds[start:stop] = rounds
+        bits = np.packbits(np.asarray(rounds) > 0, bitorder="little")
+        self._bitset[start // 8 : start // 8 + len(bits)] = bits
+
+    def is_feasible(self, rank: int) -> bool:
+        self._check_rank(rank)
+        return bool(self._bitset[rank // 8] >> (rank % 8) & 1)
+
+    def get_num_rounds(self, rank: int) -> int | None:
+        self._check_rank(rank)
+        num_rounds = int(self._rounds[rank])
+        return num_rounds if num_rounds > 0 else None
+
+    def count_feasible(self, chunk_size: int = 1 << 20) -> int:
+        """Count the feasible team priorities (popcount of the bitset, chunk by chunk)"""
+        return sum(
+            int(_POPCOUNT[self._bitset[i : i + chunk_size]].sum(dtype=np.int64))
+            for i in range(0, len(self._bitset), chunk_size)
+        )
+
+    def count_rounds(self, chunk_size: int = 1 << 20) -> dict[int, int]:
+        """Return the histogram of the number of rounds over the feasible team priorities"""
+        histogram = np.zeros(256, dtype=np.int64)
+        for i in range(0, self.num_profiles, chunk_size):
+            histogram += np.bincount(self._rounds[i : i + chunk_size], minlength=256)
+        return {r: int(c) for r, c in enumerate(histogram) if r > 0 and c > 0}
+
+    def iter_feasible(self, chunk_size: int = 1 << 20) -> Iterator[int]:
+        """Yield the feasible ranks lazily in increasing order"""
+        for i in range(0, len(self._bitset), chunk_size):
+            bits = np.unpackbits(self._bitset[i : i + chunk_size], bitorder="little")
+            for k in np.flatnonzero(bits).tolist():
+                yield 8 * i + k
+
+    def iter_ranks_with_rounds(self, num_rounds: int, chunk_size: int = 1 << 20) -> Iterator[int]:
+        """Yield the ranks whose number of rounds is num_rounds lazily in increasing order"""
+        for i in range(0, self.num_profiles, chunk_size):
+            for k in np.flatnonzero(self._rounds[i : i + chunk_size] == num_rounds).tolist():
+                yield i + k
+
+    def flush(self) -> None:
+        if self._writable and not self._mmap.closed:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        # The numpy views must be released before the mmap is closed.
+        self.__dict__.pop("_bitset", None)
+        self.__dict__.pop("_rounds", None)
+        if not self._mmap.closed:
+            if self._writable:
+                self._mmap.flush()
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
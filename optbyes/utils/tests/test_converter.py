@@ -0,0 +1,7 @@
+from optbyes.utils import converter, generator
+
+
+def test_team_priority_array_round_trip_teams4() -> None:
+    for tp in generator.generate_team_priorities(4, 1):
+        tp_array = converter.convert_team_priority_to_team_priority_array(tp)
+        assert converter.convert_team_priority_array_to_team_priority(4, tp_array) == tp
@@ -0,0 +1,37 @@
+import optbyes as opb
+from optbyes.utils import enumerator, generator
+
+
+def _count_by_graph_algorithm(num_teams: int, num_fixed: int) -> tuple[int, int, dict[int, int]]:
+    cnt, cnt_feasible = 0, 0
+    rounds: dict[int, int] = {}
+    for tp in generator.generate_team_priorities(num_teams, num_fixed):
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver.solve()
+        if solver.get_status() == opb.OPTIMAL:
+            cnt_feasible += 1
+            num_rounds = solver.get_num_rounds()
+            rounds[num_rounds] = rounds.get(num_rounds, 0) + 1
+        cnt += 1
+    return cnt, cnt_feasible, dict(sorted(rounds.items()))
+
+
+def test_teams4() -> None:
+    assert enumerator.count_feasible_team_priorities(4) == (1296, 426, {3: 6, 4: 36, 5: 144, 6: 240})
+
+
+def test_same_as_graph_algorithm() -> None:
+    for num_teams in [3, 4]:
+        for num_fixed in range(num_teams + 1):
+            expected = _count_by_graph_algorithm(num_teams, num_fixed)
+            assert enumerator.count_feasible_team_priorities(num_teams, num_fixed) == expected
+
+
+def test_relabeling_symmetry() -> None:
+    cnt, cnt_feasible, rounds = enumerator.count_feasible_team_priorities(5, 1)
+    assert enumerator.count_feasible_team_priorities(5) == (
+        24 * cnt,
+        24 * cnt_feasible,
+        {r: 24 * c for r, c in rounds.items()},
+    )
+    assert sum(rounds.values()) == cnt_feasible
@@ -1,4 +1,7 @@
-from optbyes.utils import generator
+import numpy as np
+
+import optbyes as opb
+from optbyes.utils import converter, generator
 
 
 def test_teams4() -> None:
@@ -7,3 +10,52 @@ def test_teams4() -> None:
     for i in range(num_teams + 1):
         tps = generator.generate_team_priorities(num_teams, i)
         assert len(tps) == num_tps[i]
+
+
+def test_unrank_matches_generate_teams4() -> None:
+    num_teams = 4
+    for num_fixed in range(num_teams + 1):
+        tps = generator.generate_team_priorities(num_teams, num_fixed)
+        assert generator.count_team_priorities(num_teams, num_fixed) == len(tps)
+        for rank, tp in enumerate(tps):
+            assert generator.unrank_team_priority(num_teams, rank, num_fixed) == tp
+
+
+def test_priority_arrays_are_permutations() -> None:
+    for num_teams in [2, 5, 8, 101]:
+        expected = [[i for i in range(1, num_teams + 1) if i != t] for t in range(1, num_teams + 1)]
+        for priority_array in [
+            generator.generate_random_priority_array(num_teams, seed=0),
+            generator.generate_feasible_priority_array(num_teams, seed=0),
+            generator.generate_near_feasible_priority_array(num_teams, 3, seed=0),
+        ]:
+            assert priority_array.shape == (num_teams, num_teams - 1)
+            assert np.sort(priority_array, axis=1).tolist() == expected
+
+
+def test_priority_arrays_are_reproducible() -> None:
+    for seed in range(3):
+        a1 = generator.generate_random_priority_array(50, seed=seed)
+        a2 = generator.generate_random_priority_array(50, seed=seed)
+        assert (a1 == a2).all()
+        f1 = generator.generate_near_feasible_priority_array(51, 5, seed=seed)
+        f2 = generator.generate_near_feasible_priority_array(51, 5, seed=seed)
+        assert (f1 == f2).all()
+
+
+def test_near_feasible_priority_array_swaps_distinct_teams() -> None:
+    for num_teams in [3, 4, 8]:
+        for seed in range(20):
+            feasible = generator.generate_feasible_priority_array(num_teams, seed=seed)
+            near_feasible = generator.generate_near_feasible_priority_array(num_teams, 1, seed=seed)
+            assert (feasible != near_feasible).sum() == 2
+
+
+def test_feasible_priority_array() -> None:
+    for num_teams in range(2, 12):
+        priority_array = generator.generate_feasible_priority_array(num_teams, seed=num_teams)
+        tp = converter.convert_priority_array_to_team_priority(priority_array)
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver.solve()
+        assert solver.get_status() == opb.OPTIMAL
+        assert solver.get_num_rounds() == num_teams - 1 + num_teams % 2
@@ -0,0 +1,97 @@
+import networkx as nx
+import pytest
+
+import optbyes as opb
+from optbyes.utils import converter, generator, precedence
+
+
+def test_adjacency_same_as_graph() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        G = converter.convert_team_priority_to_graph(tp)
+        nodes = list(G.nodes)
+        pred, succ = precedence.convert_team_priority_to_adjacency(tp)
+        for u, (i, j) in enumerate(nodes):
+            assert precedence.match_index(4, i, j) == u
+            assert {nodes[v] for v in pred[u] if v >= 0} == set(G.predecessors((i, j)))
+            assert {nodes[v] for v in succ[u] if v >= 0} == set(G.successors((i, j)))
+
+
+def test_longest_paths() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        G = converter.convert_team_priority_to_graph(tp)
+        longest_paths = precedence.compute_longest_paths(*precedence.convert_team_priority_to_adjacency(tp))
+        if not nx.is_directed_acyclic_graph(G):
+            assert longest_paths is None
+            continue
+        assert longest_paths is not None
+        head, tail = longest_paths
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver.solve()
+        assert head.max() == tail.max() == solver.get_num_rounds()
+        for u, node in enumerate(G.nodes):
+            assert head[u] == 1 + max((head[list(G.nodes).index(p)] for p in G.predecessors(node)), default=0)
+
+
+def test_critical_path_analysis() -> None:
+    for tp in generator.generate_team_priorities(4, 2):
+        G = converter.convert_team_priority_to_graph(tp)
+        analysis = precedence.CriticalPathAnalysis.create_from_team_priority(tp)
+        from_graph = precedence.CriticalPathAnalysis.create_from_graph(4, G)
+        assert analysis.is_acyclic() == from_graph.is_acyclic() == nx.is_directed_acyclic_graph(G)
+        if not analysis.is_acyclic():
+            with pytest.raises(opb.InfeasibleInstanceError):
+                analysis.get_lower_bound()
+            continue
+        assert (analysis.get_earliest_rounds() == from_graph.get_earliest_rounds()).all()
+        assert (analysis.get_slacks() == from_graph.get_slacks()).all()
+
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+        solver.solve()
+        num_rounds = solver.get_num_rounds()
+        assert analysis.get_lower_bound() == num_rounds
+        assert analysis.get_slacks().min() == 0
+        assert (analysis.get_slacks(num_rounds + 2) == analysis.get_slacks() + 2).all()
+
+        # The topological sort plays every match in its earliest round.
+        earliest = dict(zip(analysis.get_matches(), analysis.get_earliest_rounds().tolist()))
+        schedule = solver.get_schedule()
+        for (i, j), r in earliest.items():
+            assert schedule[i][r] == j
+        finish = analysis.get_team_earliest_finish()
+        assert finish == {t: max(r for r, j in schedule[t].items() if j != opb.BYES) for t in tp}
+
+        chain = analysis.get_critical_chain()
+        assert len(chain) == num_rounds
+        assert all(G.has_edge(u, v) for u, v in zip(chain, chain[1:]))
+
+
+def test_critical_path_analysis_cached() -> None:
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+    analysis = solver.get_critical_path_analysis()
+    solver.solve()
+    assert solver.get_critical_path_analysis() is analysis
+    assert analysis.get_lower_bound() == solver.get_num_rounds()
+
+    G = converter.convert_team_priority_to_graph(tp)
+    solver = opb.TopologicalSortAlgorithm.create_from_graph(4, G)
+    solver.solve()
+    assert solver.get_critical_path_analysis().get_critical_chain() == analysis.get_critical_chain()
+
+
+def test_critical_path_analysis_of_subclass_without_override() -> None:
+    class _ScheduleAlgorithm(opb.OptByesAlgorithm):
+        def __init__(self, schedule: opb.Schedule) -> None:
+            super().__init__()
+            self._schedule_to_return = schedule
+
+        def solve(self) -> None:
+            self._status = opb.OPTIMAL
+            self._schedule = self._schedule_to_return
+
+    tp: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 3, 4), 3: (1, 2, 4), 4: (1, 2, 3)}
+    solver = opb.TopologicalSortAlgorithm.create_from_team_priority(tp)
+    solver.solve()
+    algorithm = _ScheduleAlgorithm(solver.get_schedule())
+    algorithm.solve()
+    assert algorithm.get_critical_path_analysis().get_lower_bound() == solver.get_num_rounds()
@@ -0,0 +1,72 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import optbyes as opb
+from optbyes.utils import converter, generator, precedence, validator
+from optbyes.utils.priority_array import PriorityArray, PriorityArrayFile
+
+
+def _relabel(tp: opb.TeamPriority, labels: list[int]) -> opb.TeamPriority:
+    return {labels[t - 1]: tuple(labels[j - 1] for j in opposing_teams) for t, opposing_teams in tp.items()}
+
+
+def test_mapping_and_bytes() -> None:
+    for tp in generator.generate_team_priorities(4, 3):
+        pa = PriorityArray.from_team_priority(tp)
+        assert pa == tp
+        assert dict(pa) == tp == pa.to_team_priority()
+        assert converter.convert_priority_array_to_team_priority(pa) == tp
+        assert PriorityArray.from_bytes(pa.to_bytes()) == pa
+        assert pickle.loads(pickle.dumps(pa)) == pa
+        pred, succ = precedence.convert_team_priority_to_adjacency(pa)
+        assert (pred == precedence.convert_team_priority_to_adjacency(tp)[0]).all()
+        assert (succ == precedence.convert_team_priority_to_adjacency(tp)[1]).all()
+    with pytest.raises(ValueError):
+        PriorityArray(np.array([[2, 2], [1, 3], [1, 2]]))
+
+
+def test_canonical_hash() -> None:
+    rng = np.random.default_rng(0)
+    hashes = set()
+    for seed in range(50):
+        pa = PriorityArray(generator.generate_random_priority_array(8, seed=seed))
+        labels = (rng.permutation(8) + 1).tolist()
+        relabeled = PriorityArray.from_team_priority(_relabel(pa.to_team_priority(), labels))
+        assert relabeled.canonical_hash() == pa.canonical_hash()
+        hashes.add(pa.canonical_hash())
+    assert len(hashes) == 50
+
+
+def test_algorithms_accept_priority_array() -> None:
+    for seed in range(20):
+        pa = PriorityArray(generator.generate_near_feasible_priority_array(6, 1, seed=seed))
+        solver = opb.TopologicalSortAlgorithm.create_from_team_priority(pa)
+        solver.solve()
+        expected = opb.TopologicalSortAlgorithm.create_from_team_priority(pa.to_team_priority())
+        expected.solve()
+        assert solver.get_status() == expected.get_status()
+        if solver.get_status() == opb.OPTIMAL:
+            assert solver.get_schedule() == expected.get_schedule()
+            assert validator.validate_schedule(pa, solver.get_schedule()) == []
+
+
+def test_priority_array_file(tmp_path: Path) -> None:
+    path = tmp_path / "profiles.bin"
+    priorities = [PriorityArray(generator.generate_random_priority_array(5, seed=seed)) for seed in range(10)]
+    with PriorityArrayFile.create(path, num_teams=5) as f:
+        assert len(f) == 0
+        f.append(priorities[0])
+        f.append(np.stack([pa.array for pa in priorities[1:]]))
+        assert f[3] == priorities[3]
+    with PriorityArrayFile.open(path) as f:
+        assert len(f) == 10
+        assert list(f) == priorities
+        assert f.get_array().shape == (10, 5, 4)
+    with PriorityArrayFile.open(path, writable=True) as f:
+        out = PriorityArray(np.zeros((5, 4)), validate=False)
+        generator.generate_random_priority_array(5, seed=10, out=out)
+        f.append(out)
+        assert len(f) == 11 and f[10] == out
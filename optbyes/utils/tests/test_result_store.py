@@ -0,0 +1,57 @@
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from optbyes.utils.result_store import ResultStore
+
+
+def test_write_and_query(tmp_path: Path) -> None:
+    path = tmp_path / "results.bin"
+    with ResultStore.create(path, num_profiles=21, num_teams=4) as store:
+        store.write(0, 3)
+        store.write(5, 4)
+        store.write(20, 3)
+        store.write(7, 6)
+        store.write(7, None)
+    with ResultStore.open(path) as store:
+        assert (store.num_profiles, store.num_teams, store.num_fixed) == (21, 4, 0)
+        assert store.count_feasible() == 3
+        assert list(store.iter_feasible()) == [0, 5, 20]
+        assert list(store.iter_ranks_with_rounds(3, chunk_size=8)) == [0, 20]
+        assert store.count_rounds() == {3: 2, 4: 1}
+        assert store.is_feasible(5) and not store.is_feasible(7)
+        assert store.get_num_rounds(5) == 4 and store.get_num_rounds(7) is None
+        with pytest.raises(IndexError):
+            store.get_num_rounds(21)
+
+
+def _write_shard(path: Path, start: int, stop: int) -> None:
+    with ResultStore.create(path, num_profiles=1000) as store:
+        rounds = np.array([r % 5 for r in range(start, stop)], dtype=np.uint8)
+        store.write_batch(start, rounds)
+
+
+def test_parallel_write_batch(tmp_path: Path) -> None:
+    path = tmp_path / "results.bin"
+    shards = [(0, 248), (248, 600), (600, 1000)]
+    processes = [multiprocessing.Process(target=_write_shard, args=(path, *shard)) for shard in shards]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+        assert p.exitcode == 0
+    with ResultStore.open(path) as store:
+        expected = [r for r in range(1000) if r % 5 != 0]
+        assert store.count_feasible(chunk_size=7) == len(expected)
+        assert list(store.iter_feasible(chunk_size=7)) == expected
+        assert store.count_rounds(chunk_size=64) == {1: 200, 2: 200, 3: 200, 4: 200}
+
+
+def test_write_batch_alignment(tmp_path: Path) -> None:
+    with ResultStore.create(tmp_path / "results.bin", num_profiles=100) as store:
+        with pytest.raises(ValueError):
+            store.write_batch(4, np.ones(8, dtype=np.uint8))
+        store.write_batch(96, np.ones(4, dtype=np.uint8))
+        assert store.count_feasible() == 4
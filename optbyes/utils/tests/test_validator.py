@@ -0,0 +1,53 @@
+import optbyes as opb
+from optbyes.utils import validator
+
+TP: opb.TeamPriority = {1: (2, 3, 4), 2: (1, 4, 3), 3: (4, 1, 2), 4: (3, 2, 1)}
+
+
+def _valid_schedule() -> opb.Schedule:
+    return {
+        1: {1: 2, 2: 3, 3: 4},
+        2: {1: 1, 2: 4, 3: 3},
+        3: {1: 4, 2: 1, 3: 2},
+        4: {1: 3, 2: 2, 3: 1},
+    }
+
+
+def test_valid_schedule() -> None:
+    assert validator.validate_schedule(TP, _valid_schedule()) == []
+
+
+def test_valid_schedule_with_byes() -> None:
+    tp: opb.TeamPriority = {1: (2, 3), 2: (1, 3), 3: (1, 2)}
+    schedule: opb.Schedule = {1: {1: 2, 2: 3, 3: opb.BYES}, 2: {1: 1, 2: opb.BYES, 3: 3}, 3: {1: opb.BYES, 2: 1, 3: 2}}
+    assert validator.validate_schedule(tp, schedule) == []
+
+
+def test_priority_order() -> None:
+    schedule = _valid_schedule()
+    schedule[3] = {1: 1, 2: 4, 3: 2}
+    schedule[1] = {1: 3, 2: 2, 3: 4}
+    schedule[2] = {1: 4, 2: 1, 3: 3}
+    schedule[4] = {1: 2, 2: 3, 3: 1}
+    kinds = {(v.kind, v.team) for v in validator.validate_schedule(TP, schedule)}
+    assert kinds == {("priority_order", 1), ("priority_order", 2), ("priority_order", 3), ("priority_order", 4)}
+
+
+def test_double_booked_and_pair_count() -> None:
+    schedule = _valid_schedule()
+    schedule[1][3] = 3  # team 1 plays team 3 twice and never plays team 4
+    violations = validator.validate_schedule(TP, schedule)
+    kinds = {(v.kind, v.team, v.round, v.opponent) for v in violations}
+    assert ("double_booked", 1, 3, 3) in kinds
+    assert ("double_booked", 4, 3, 1) in kinds
+    assert ("pair_count", 1, 0, 3) in kinds
+    assert ("pair_count", 1, 0, 4) in kinds
+
+
+def test_missing_round_and_invalid_opponent() -> None:
+    schedule = _valid_schedule()
+    del schedule[2][3]
+    schedule[4][1] = 4
+    kinds = {(v.kind, v.team, v.round) for v in validator.validate_schedule(TP, schedule)}
+    assert ("missing_round", 2, 3) in kinds
+    assert ("invalid_opponent", 4, 1) in kinds
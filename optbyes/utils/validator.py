@@ -0,0 +1,135 @@
+from typing import NamedTuple
+
+import numpy as np
+
+import optbyes as opb
+from optbyes.utils.priority_array import PriorityArray, TeamPriorityLike
+
+__all__ = [
+    "ScheduleViolation",
+    "validate_schedule",
+]
+
+
+class ScheduleViolation(NamedTuple):
+    """A violation found in a schedule
+
+    kind is one of
+    "missing_round" (team has no entry for the round), "invalid_opponent" (unknown team or itself),
+    "double_booked" (the opponent does not play team in the round), "pair_count" (team does not meet
+    opponent exactly once) and "priority_order" (team plays opponent against its priority).
+    round is 0 and/or opponent is 0 when the violation is not about a specific round/opponent.
+    """
+
+    kind: str
+    team: int
+    round: int
+    opponent: int
+    message: str
+
+
+def _schedule_to_array(num_teams: int, schedule: opb.Schedule) -> tuple[np.ndarray, list[ScheduleViolation]]:
+    """Return the (num_teams + 1) x (num_rounds + 1) array of opponents (row/column 0 is unused)"""
+    violations: list[ScheduleViolation] = []
+    num_rounds = max((max(opposing_teams, default=0) for opposing_teams in schedule.values()), default=0)
+    array = np.full((num_teams + 1, num_rounds + 1), opb.BYES, dtype=np.int64)
+    for t in range(1, num_teams + 1):
+        opposing_teams = schedule.get(t, {})
+        for r in range(1, num_rounds + 1):
+            if r not in opposing_teams:
+                violations.append(ScheduleViolation("missing_round", t, r, 0, f"team {t} has no entry for round {r}"))
+                continue
+            array[t, r] = opposing_teams[r]
+    return array, violations
+
+
+def validate_schedule(team_priority: TeamPriorityLike, schedule: opb.Schedule) -> list[ScheduleViolation]:
+    """Validate a schedule against team_priority
+
+    Check that each pair of teams meets exactly once, no team plays twice in a round,
+    and the order of the opposing teams of every team respects its priority.
+    The checks are done with array operations over the num_teams x num_rounds schedule.
+
+    Parameters
+    -----
+    team_priority: TeamPriorityLike
+        A dictionary of the team's desired priority order
+
+    schedule: opb.Schedule
+        The schedule to validate
+
+    Returns
+    -----
+    violations: list[ScheduleViolation]
+        The violations found (empty if the schedule is valid)
+
+    Examples
+    -----
+    >>> tp = {1: (2, 3), 2: (1, 3), 3: (1, 2)}
+    >>> validate_schedule(tp, {1: {1: 2, 2: 3, 3: -1}, 2: {1: 1, 2: -1, 3: 3}, 3: {1: -1, 2: 1, 3: 2}})
+    >>> []
+    """
+    num_teams = len(team_priority)
+    array, violations = _schedule_to_array(num_teams, schedule)
+    teams = np.arange(num_teams + 1)[:, np.newaxis]
+    rounds = np.arange(array.shape[1])[np.newaxis, :]
+    rounds = np.broadcast_to(rounds, array.shape)
+
+    # 1. Opponents are other existing teams (or byes)
+    is_match = array != opb.BYES
+    is_match[0, :] = False
+    is_match[:, 0] = False
+    invalid = is_match & ((array < 1) | (array > num_teams) | (array == teams))
+    for t, r in zip(*np.nonzero(invalid)):
+        violations.append(
+            ScheduleViolation("invalid_opponent", t, r, array[t, r], f"team {t} plays invalid team {array[t, r]}")
+        )
+    is_match &= ~invalid
+
+    # 2. No team plays twice in a round: the opponent of team t must play team t in the same round
+    opponents = np.where(is_match, array, 0)
+    double_booked = is_match & (array[opponents, rounds] != teams)
+    for t, r in zip(*np.nonzero(double_booked)):
+        j = array[t, r]
+        violations.append(
+            ScheduleViolation(
+                "double_booked", t, r, j, f"team {t} plays team {j} in round {r}, but team {j} plays {array[j, r]}"
+            )
+        )
+
+    # 3. Each pair of teams meets exactly once
+    num_meets = np.zeros((num_teams + 1, num_teams + 1), dtype=np.int64)
+    match_teams, match_rounds = np.nonzero(is_match)
+    np.add.at(num_meets, (match_teams, array[match_teams, match_rounds]), 1)
+    np.fill_diagonal(num_meets, 1)
+    for t, j in zip(*np.nonzero(num_meets[1:, 1:] != 1)):
+        violations.append(
+            ScheduleViolation(
+                "pair_count", t + 1, 0, j + 1, f"team {t + 1} meets team {j + 1} {num_meets[t + 1, j + 1]} times"
+            )
+        )
+
+    # 4. The opposing teams of every team are played in its priority order
+    round_of = np.zeros((num_teams + 1, num_teams + 1), dtype=np.int64)  # round_of[t, j] (last meeting)
+    round_of[match_teams, array[match_teams, match_rounds]] = match_rounds
+    if isinstance(team_priority, PriorityArray):
+        priority = team_priority.array.astype(np.int64)
+    else:
+        priority = np.array([team_priority[t] for t in range(1, num_teams + 1)], dtype=np.int64)
+    priority = priority.reshape(num_teams, -1)
+    priority_rounds = round_of[np.arange(1, num_teams + 1)[:, np.newaxis], priority]
+    latest_rounds = np.maximum.accumulate(priority_rounds, axis=1)  # latest round of the preceding opponents
+    too_early = (priority_rounds[:, 1:] > 0) & (priority_rounds[:, 1:] <= latest_rounds[:, :-1])
+    for t, k in zip(*np.nonzero(too_early)):
+        j, r = priority[t, k + 1], priority_rounds[t, k + 1]
+        violations.append(
+            ScheduleViolation(
+                "priority_order",
+                t + 1,
+                r,
+                j,
+                f"team {t + 1} plays team {j} in round {r}, "
+                f"not after a preceding opposing team (round {latest_rounds[t, k]})",
+            )
+        )
+    return [ScheduleViolation(v.kind, int(v.team), int(v.round), int(v.opponent), v.message) for v in violations]